@@ -10,41 +10,90 @@ import os
 import sys
 import shutil
 from pathlib import Path
-from flask import Flask
+from tempfile import SpooledTemporaryFile
+from flask import Flask, Request
 from typing import Tuple, List
 # 添加项目路径以支持模块导入
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
-# 导入配置和中间件
+# 导入配置（控制器、中间件等在 create_app 中按需导入，缩短启动和测试时间）
 from backend.common.config import config
-from backend.common.middleware import error_handler, request_logger
-from backend.models.models import init_database
 from backend.common.logger import get_logger
-
-# 导入所有控制器
-from backend.controllers.room_controller import room_bp
-from backend.controllers.session_controller import session_bp
-from backend.controllers.question_controller import question_bp
-from backend.controllers.report_controller import report_bp
-from backend.controllers.resume_controller import resume_bp
-from backend.controllers.api_controller import api_bp
-# 启动方式：使用 uvicorn 兼容的方式
-import uvicorn
 import connexion
-from backend.utils import encoder
 
 logger = get_logger(__name__)
 
+# 蓝图导入路径，注册时才真正导入对应控制器模块
+BLUEPRINTS = (
+    'backend.controllers.room_controller:room_bp',
+    'backend.controllers.session_controller:session_bp',
+    'backend.controllers.question_controller:question_bp',
+    'backend.controllers.report_controller:report_bp',
+    'backend.controllers.resume_controller:resume_bp',
+    'backend.controllers.api_controller:api_bp',
+)
+
+# 第三方静态资源（bootstrap/jquery等）内容固定，允许浏览器长期缓存
+VENDOR_STATIC_PREFIX = 'vendor/'
+VENDOR_STATIC_MAX_AGE = 365 * 24 * 3600
+
+# 响应压缩：JSON列表等文本响应压缩率很高，小响应不值得压缩
+GZIP_MINIMUM_SIZE = 500
+GZIP_COMPRESS_LEVEL = 4
+# 本身已压缩的内容（PDF下载、字体、图片）不再压缩：重复压缩只耗CPU，还会去掉Content-Length导致浏览器无法显示下载进度
+GZIP_EXCLUDED_PATH_PREFIXES = ('/api/reports/download/',)
+GZIP_EXCLUDED_EXTENSIONS = ('.pdf', '.woff', '.woff2', '.png', '.jpg', '.jpeg', '.gif', '.webp', '.ico')
+
+# 上传文件在内存中缓冲的上限：简历PDF通常只有几MB，不超过该大小时不写临时文件
+# （Werkzeug默认超过500KB即落盘）
+UPLOAD_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+
+class SpooledUploadRequest(Request):
+    """上传文件先缓冲在内存中，超过UPLOAD_SPOOL_MAX_SIZE才转存到临时文件"""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_SIZE, mode='rb+')
+
+
+class SelectiveGZipMiddleware:
+    """gzip压缩中间件，按请求路径跳过已压缩的内容"""
+
+    def __init__(self, app, **gzip_options):
+        from starlette.middleware.gzip import GZipMiddleware
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, **gzip_options)
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get('path', '')
+        if scope['type'] == 'http' and (
+            path.startswith(GZIP_EXCLUDED_PATH_PREFIXES) or path.lower().endswith(GZIP_EXCLUDED_EXTENSIONS)
+        ):
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip_app(scope, receive, send)
+
+
+def _static_max_age(filename):
+    """静态文件缓存时间：vendor目录长期缓存，其余走Flask默认的条件请求"""
+    if filename and filename.startswith(VENDOR_STATIC_PREFIX):
+        return VENDOR_STATIC_MAX_AGE
+    return None
+
 
 def create_app() -> connexion.App:
     """创建Flask应用实例，并集成Connexion"""
+    from werkzeug.utils import import_string
+    from backend.common.middleware import error_handler, request_logger
+    from backend.utils import encoder
+
     # 创建 Connexion App（它内部会创建一个 Flask app）
     specification_dir = str(project_root / 'backend/openapi')
     connex_app = connexion.App(__name__, specification_dir=specification_dir)
 
-    # 设置 JSON 编码器
-    connex_app.app.json.default = encoder.custom_json_default
+    # 设置 JSON 编码器（orjson）
+    connex_app.app.json = encoder.OrjsonProvider(connex_app.app)
 
     # 添加 API（这会自动注册 /ui, /openapi.json 等）
     connex_app.add_api(
@@ -59,14 +108,26 @@ def create_app() -> connexion.App:
     connex_app.app.secret_key = config.SECRET_KEY
     connex_app.app.template_folder = 'frontend/templates'
     connex_app.app.static_folder = 'frontend/static'
+    connex_app.app.get_send_file_max_age = _static_max_age
+    connex_app.app.request_class = SpooledUploadRequest
+
+    # 模板：仅调试模式下检查文件变更；生产环境缓存编译后的字节码，重启后无需重新编译
+    connex_app.app.config['TEMPLATES_AUTO_RELOAD'] = config.FLASK_DEBUG
+    if not config.FLASK_DEBUG:
+        from jinja2 import FileSystemBytecodeCache
+        connex_app.app.jinja_env.auto_reload = False
+        connex_app.app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
 
     # 注册你的蓝图
-    connex_app.app.register_blueprint(room_bp)
-    connex_app.app.register_blueprint(session_bp)
-    connex_app.app.register_blueprint(question_bp)
-    connex_app.app.register_blueprint(report_bp)
-    connex_app.app.register_blueprint(resume_bp)
-    connex_app.app.register_blueprint(api_bp)
+    for blueprint_path in BLUEPRINTS:
+        connex_app.app.register_blueprint(import_string(blueprint_path))
+
+    # 响应gzip压缩（ASGI层，流式响应按块压缩；PDF下载等已压缩内容原样返回）
+    connex_app.add_middleware(
+        SelectiveGZipMiddleware,
+        minimum_size=GZIP_MINIMUM_SIZE,
+        compresslevel=GZIP_COMPRESS_LEVEL
+    )
 
     # 注册中间件
     error_handler(connex_app.app)
@@ -85,6 +146,7 @@ def init_app() -> None:
         sys.exit(1)
 
     # 初始化数据库
+    from backend.models.models import init_database
     try:
         init_database()
         logger.info("Database initialized successfully")
@@ -93,23 +155,18 @@ def init_app() -> None:
         sys.exit(1)
 
 
-if __name__ == '__main__':
-    # 确保日志目录存在
-    logs_dir = project_root / 'logs'
-    logs_dir.mkdir(exist_ok=True)
-
-    # 初始化应用
-    logger.info("Starting Yeying Interviewer System...")
-    init_app()
-
-    # 创建Flask应用
-    app = create_app()
-
-    # 配置Flask/Werkzeug的日志也输出到文件
+def setup_werkzeug_logging() -> None:
+    """配置Flask/Werkzeug的日志也输出到文件（经队列由后台线程写入，不阻塞请求）"""
     import logging
     from logging.handlers import RotatingFileHandler
+    from backend.common.logger import create_queue_handler
+
+    logs_dir = project_root / 'logs'
+    logs_dir.mkdir(exist_ok=True)
 
     werkzeug_logger = logging.getLogger('werkzeug')
+    if not config.FLASK_DEBUG:
+        werkzeug_logger.setLevel(logging.WARNING)
     werkzeug_handler = RotatingFileHandler(
         logs_dir / 'interviewer.log',
         maxBytes=10 * 1024 * 1024,
@@ -121,15 +178,33 @@ if __name__ == '__main__':
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     werkzeug_handler.setFormatter(werkzeug_formatter)
-    werkzeug_logger.addHandler(werkzeug_handler)
+    werkzeug_logger.addHandler(create_queue_handler(werkzeug_handler))
+
+
+def serve_app() -> connexion.App:
+    """uvicorn应用工厂：在服务进程内完成日志配置并创建应用"""
+    setup_werkzeug_logging()
+    return create_app()
+
+
+if __name__ == '__main__':
+    # 初始化应用
+    logger.info("Starting Yeying Interviewer System...")
+    init_app()
 
-    # 启动应用
+    # 启动应用：uvicorn 通过导入字符串调用工厂函数创建应用，
+    # 这样 reload 模式下的子进程也能正确加载同一个入口
+    import uvicorn
     logger.info(f"Server running on http://{config.APP_HOST}:{config.APP_PORT}")
     logger.info(f"Debug mode: {config.FLASK_DEBUG}")
     uvicorn.run(
-        app,  # 注意：这里传的是内部的 ASGI app
+        'app:serve_app',
+        factory=True,
         host=config.APP_HOST,
         port=config.APP_PORT,
         reload=config.FLASK_DEBUG,  # uvicorn 用 reload 代替 debug
+        workers=None if config.FLASK_DEBUG else config.APP_WORKERS,  # reload 与多进程互斥
+        loop='auto',  # 安装了 uvloop 时自动使用
+        http='auto',  # 安装了 httptools 时自动使用
         log_level="info"
     )
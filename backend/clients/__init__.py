@@ -5,7 +5,7 @@
 """
 
 # MinIO对象存储客户端
-from .minio_client import minio_client, download_resume_data, upload_resume_data
+from .minio_client import get_minio_client, download_resume_data, upload_resume_data
 
 # DigitalHub数字人服务客户端
 from .digitalhub_client import ping_dh, boot_dh, start_llm
@@ -15,7 +15,7 @@ from .mineru_client import MinerUClient, get_mineru_client
 
 __all__ = [
     # MinIO
-    'minio_client',
+    'get_minio_client',
     'download_resume_data',
     'upload_resume_data',
 
@@ -5,6 +5,9 @@ DigitalHub数字人服务客户端
 import os
 from typing import Optional, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from backend.common.cache import TTLCache
 from backend.common.logger import get_logger
 
 logger = get_logger(__name__)
@@ -12,14 +15,39 @@ logger = get_logger(__name__)
 # DIGITALHUB_BASE = os.getenv("DIGITALHUB_BASE", "http://127.0.0.1:9009")
 DIGITALHUB_BASE = os.getenv("DIGITALHUB_BASE", "https://digitalhub.yeying.pub")
 
+
+def _create_session() -> requests.Session:
+    """创建复用连接的HTTP会话（仅对GET等幂等请求在网关错误时重试）"""
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({"Accept": "application/json"})
+    return session
+
+
+# 模块级会话：保持keep-alive，避免每次调用都重新建立TCP/TLS连接
+_session = _create_session()
+
+
+# ping结果短时缓存：首页、面试间页面每次访问都会ping，窗口内只实际请求一次
+PING_CACHE_TTL = 5
+_ping_cache = TTLCache(ttl=PING_CACHE_TTL, maxsize=1)
+
+
+def _fetch_ping() -> Dict[str, Any]:
+    r = _session.get(f"{DIGITALHUB_BASE}/api/v1/dh/ping", timeout=3)
+    r.raise_for_status()
+    data = r.json()
+    logger.info(f"DH ping: {data}")
+    return data
+
+
 def ping_dh() -> Dict[str, Any]:
-    """Ping数字人服务"""
+    """Ping数字人服务（成功结果缓存PING_CACHE_TTL秒，并发调用只发出一次请求；失败不缓存）"""
     try:
-        r = requests.get(f"{DIGITALHUB_BASE}/api/v1/dh/ping", timeout=3)
-        r.raise_for_status()
-        data = r.json()
-        logger.info(f"DH ping: {data}")
-        return data
+        return _ping_cache.get_or_load('ping', _fetch_ping)
     except Exception as e:
         logger.warning(f"DH ping failed: {e}")
         return {"code": 500, "data": {"running": False, "error": str(e)}}
@@ -31,7 +59,7 @@ def boot_dh(room_id: str, session_id: str, timeout_sec: int = 90,
     payload = {"room_id": room_id, "session_id": session_id, "timeout_sec": timeout_sec}
     if public_host:
         payload["public_host"] = public_host
-    r = requests.post(f"{DIGITALHUB_BASE}/api/v1/dh/boot", json=payload, timeout=timeout_sec + 10)
+    r = _session.post(f"{DIGITALHUB_BASE}/api/v1/dh/boot", json=payload, timeout=timeout_sec + 10)
     r.raise_for_status()
     data = r.json()
     logger.info(f"DH boot: {data}")
@@ -54,7 +82,7 @@ def start_llm(room_id: str, session_id: str, round_index: int, *,
         "minio_bucket": minio_bucket,
         "minio_secure": minio_secure,
     }
-    r = requests.post(f"{DIGITALHUB_BASE}/api/v1/dh/llm/start", json=payload, timeout=30)
+    r = _session.post(f"{DIGITALHUB_BASE}/api/v1/dh/llm/start", json=payload, timeout=30)
     r.raise_for_status()
     data = r.json()
     logger.info(f"LLM start: {data}")
@@ -2,97 +2,90 @@
 面试评价相关prompt模板
 """
 
+from string import Template
 from typing import Dict, List, Any
 
 
-def get_interview_evaluation_prompt(qa_data: Dict[str, Any]) -> str:
-    """
-    生成面试评价的prompt模板
-    基于华为面试报告格式进行评价
-    """
-    qa_pairs = qa_data.get('qa_pairs', [])
-    session_info = qa_data.get('session_info', {})
-
-    qa_content = ""
-    for i, qa in enumerate(qa_pairs, 1):
-        qa_content += f"""
-问题{i}：{qa.get('question', '')}
-分类：{qa.get('category', '')}
-回答：{qa.get('answer', '')}
+# 单条QA的格式
+_QA_ITEM_TEMPLATE = """
+问题{index}：{question}
+分类：{category}
+回答：{answer}
 """
 
-    prompt = f"""
+# 面试评价prompt正文（模块加载时构建一次；使用$占位符，JSON示例中的花括号无需转义）
+_EVALUATION_PROMPT_TEMPLATE = Template("""
 请你作为专业的技术面试官，对以下面试QA进行全面评价。
 
 面试信息：
-- 会话名称：{session_info.get('session_name', '')}
-- 总题数：{len(qa_pairs)}
+- 会话名称：$session_name
+- 总题数：$total
 
 面试QA内容：
-{qa_content}
+$qa_content
 
 请按照以下JSON格式返回评价结果：
 
-{{
-    "interviewer_comment": {{
+{
+    "interviewer_comment": {
         "summary": "面试官总体评价（100-200字）",
         "suggestions": "改进建议（100-200字）"
-    }},
-    "comprehensive_analysis": {{
-        "content_completeness": {{
+    },
+    "comprehensive_analysis": {
+        "content_completeness": {
             "score": 8,
             "comment": "内容完整度评价"
-        }},
-        "highlight_prominence": {{
+        },
+        "highlight_prominence": {
             "score": 7,
             "comment": "亮点突出度评价"
-        }},
-        "logical_clarity": {{
+        },
+        "logical_clarity": {
             "score": 7,
             "comment": "逻辑清晰度评价"
-        }},
-        "expression_ability": {{
+        },
+        "expression_ability": {
             "score": 8,
             "comment": "表达能力评价"
-        }},
-        "position_matching": {{
+        },
+        "position_matching": {
             "score": 8,
             "comment": "岗位契合度评价"
-        }}
-    }},
-    "key_points_analysis": {{
-        "project_depth": {{
+        }
+    },
+    "key_points_analysis": {
+        "project_depth": {
             "level": "中",
             "description": "项目深度分析",
             "can_strengthen": true
-        }},
-        "personality_potential": {{
+        },
+        "personality_potential": {
             "level": "高",
             "description": "个性潜质分析",
             "can_strengthen": false
-        }},
-        "professional_knowledge": {{
+        },
+        "professional_knowledge": {
             "level": "中",
             "description": "专业知识点分析",
             "can_strengthen": true
-        }},
-        "soft_skills": {{
+        },
+        "soft_skills": {
             "level": "高",
             "description": "软素质分析",
             "can_strengthen": false
-        }}
-    }},
+        }
+    },
     "question_analysis": [
-        {{
+        {
             "question_number": 1,
             "question": "问题内容",
             "category": "问题分类",
             "key_points": "本题考点",
             "improvement_suggestions": "改进建议",
             "reference_answer": "参考回答"
-        }}
+        }
     ]
-}}
+}
 
 评价要求：
 1. 分数范围1-10分，要客观公正
@@ -102,8 +95,33 @@ def get_interview_evaluation_prompt(qa_data: Dict[str, Any]) -> str:
 5. 保持专业的面试官语气
 6. 针对每个问题都要给出具体的分析和改进建议
 7. 考点分析要准确，体现问题的技术深度
-"""
-    return prompt
+""")
+
+
+def get_interview_evaluation_prompt(qa_data: Dict[str, Any]) -> str:
+    """
+    生成面试评价的prompt模板
+    基于华为面试报告格式进行评价
+    """
+    qa_pairs = qa_data.get('qa_pairs', [])
+    session_info = qa_data.get('session_info', {})
+
+    # join一次拼接，避免循环中 += 反复复制字符串
+    qa_content = "".join(
+        _QA_ITEM_TEMPLATE.format(
+            index=i,
+            question=qa.get('question', ''),
+            category=qa.get('category', ''),
+            answer=qa.get('answer', '')
+        )
+        for i, qa in enumerate(qa_pairs, 1)
+    )
+
+    return _EVALUATION_PROMPT_TEMPLATE.substitute(
+        session_name=session_info.get('session_name', ''),
+        total=len(qa_pairs),
+        qa_content=qa_content
+    )
 
 
 def get_single_question_evaluation_prompt(question: str, answer: str, category: str) -> str:
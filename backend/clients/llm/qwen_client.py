@@ -4,6 +4,7 @@
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 import dashscope
 from typing import List, Dict, Optional
 
@@ -57,21 +58,28 @@ class QwenClient:
         except ImportError:
             raise ImportError("无法导入提示词模块")
         
-        result = {}
-        
-        for category, num in question_types.items():
+        def generate_category(category: str, num: int) -> List[str]:
             try:
                 prompt = get_categorized_interview_prompt(resume_content, category, num)
                 messages = [{"role": "user", "content": prompt}]
                 response = self.chat_completion(messages, temperature=0.8)
                 questions = self._parse_questions_from_response(response)
-                result[category] = questions[:num] if len(questions) > num else questions
-                
+                return questions[:num] if len(questions) > num else questions
+
             except Exception as e:
                 print(f"生成{category}时出错: {e}")
-                result[category] = []
-        
-        return result
+                return []
+
+        if not question_types:
+            return {}
+
+        # 各分类互不依赖，并发调用，总耗时取决于最慢的一次请求
+        with ThreadPoolExecutor(max_workers=len(question_types)) as executor:
+            futures = {
+                category: executor.submit(generate_category, category, num)
+                for category, num in question_types.items()
+            }
+            return {category: future.result() for category, future in futures.items()}
     
     def _parse_questions_from_response(self, response: str) -> List[str]:
         """从LLM响应中解析面试题列表"""
@@ -103,4 +111,21 @@ class QwenClient:
                 seen.add(q)
                 unique_questions.append(q)
         
-        return unique_questions
\ No newline at end of file
+        return unique_questions
+
+
+# 全局Qwen客户端实例
+_qwen_client = None
+
+
+def get_qwen_client() -> QwenClient:
+    """
+    获取 Qwen 客户端实例（单例模式）
+
+    Returns:
+        QwenClient 实例
+    """
+    global _qwen_client
+    if _qwen_client is None:
+        _qwen_client = QwenClient()
+    return _qwen_client
@@ -6,12 +6,12 @@ import os
 import time
 import uuid
 import requests
-from typing import Optional, Dict, Any
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import BinaryIO, Optional, Dict, Any, Union
+from backend.common.config import config
 from backend.common.logger import get_logger
 
-load_dotenv()
-
 logger = get_logger(__name__)
 
 
@@ -19,31 +19,39 @@ class MinerUClient:
     """MinerU PDF OCR解析客户端"""
 
     def __init__(self):
-        self.api_key = os.getenv("MINERU_API_KEY")
-        self.base_url = os.getenv("MINERU_API_URL", "https://mineru.net/api/v4")
+        self.api_key = config.MINERU_API_KEY
+        self.base_url = config.MINERU_API_URL
 
         if not self.api_key:
             raise ValueError("MINERU_API_KEY not found in environment variables")
 
         # MinerU API 认证格式：Bearer + 空格 + Token
+        # （按请求传入而不放在会话默认头中，下载结果ZIP时不会把Token发给存储服务）
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
 
-    def parse_pdf(self, pdf_file_path: str) -> Optional[str]:
+        # 复用连接的HTTP会话：解析任务需要多次轮询状态，避免每次都重新建立TLS连接
+        self.session = requests.Session()
+        retry = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def parse_pdf(self, pdf_file: Union[str, BinaryIO]) -> Optional[str]:
         """
         解析PDF文件，返回Markdown格式内容
 
         Args:
-            pdf_file_path: PDF文件路径
+            pdf_file: PDF文件路径，或可seek的二进制文件对象（如上传文件流）
 
         Returns:
             Markdown格式的解析内容，失败返回None
         """
         try:
             # 1. 先上传PDF文件到MinIO并获取URL
-            pdf_url = self._upload_pdf_to_minio(pdf_file_path)
+            pdf_url = self._upload_pdf_to_minio(pdf_file)
             if not pdf_url:
                 logger.error("Failed to upload PDF to storage")
                 return None
@@ -67,31 +75,42 @@ class MinerUClient:
             logger.error(f"Error parsing PDF with MinerU: {e}", exc_info=True)
             return None
 
-    def _upload_pdf_to_minio(self, pdf_file_path: str) -> Optional[str]:
+    def _upload_pdf_to_minio(self, pdf_file: Union[str, BinaryIO]) -> Optional[str]:
         """上传PDF文件到MinIO并返回预签名URL"""
         try:
-            from backend.clients.minio_client import minio_client
+            from backend.clients.minio_client import get_minio_client
 
-            # 检查文件是否存在
-            if not os.path.exists(pdf_file_path):
-                logger.error(f"PDF file not found: {pdf_file_path}")
-                return None
+            if isinstance(pdf_file, str):
+                # 检查文件是否存在
+                if not os.path.exists(pdf_file):
+                    logger.error(f"PDF file not found: {pdf_file}")
+                    return None
+                file_size = os.path.getsize(pdf_file)
+            else:
+                # 文件对象：通过seek获取大小后回到起始位置
+                pdf_file.seek(0, os.SEEK_END)
+                file_size = pdf_file.tell()
+                pdf_file.seek(0)
 
             # 检查文件大小（200MB限制）
-            file_size = os.path.getsize(pdf_file_path)
             if file_size > 200 * 1024 * 1024:
                 logger.error(f"PDF file too large: {file_size / (1024*1024):.2f}MB (max 200MB)")
                 return None
 
             # 上传到MinIO
             filename = f"temp/resume_{uuid.uuid4().hex}.pdf"
-            success = minio_client.upload_file(filename, pdf_file_path)
+            if isinstance(pdf_file, str):
+                success = get_minio_client().upload_file(filename, pdf_file)
+            else:
+                success = get_minio_client().upload_stream(
+                    filename, pdf_file, file_size, content_type='application/pdf'
+                )
 
             if not success:
                 return None
 
             # 生成预签名URL（24小时有效）
-            presigned_url = minio_client.get_presigned_url(filename, expires_hours=24)
+            presigned_url = get_minio_client().get_presigned_url(filename, expires_hours=24)
 
             if not presigned_url:
                 logger.error("Failed to generate presigned URL")
@@ -115,7 +134,7 @@ class MinerUClient:
                 "enable_formula": False,
             }
 
-            response = requests.post(url, headers=self.headers, json=data, timeout=30)
+            response = self.session.post(url, headers=self.headers, json=data, timeout=30)
 
             if response.status_code == 200:
                 result = response.json()
@@ -148,7 +167,7 @@ class MinerUClient:
             status_url = f"{self.base_url}/extract/task/{task_id}"
 
             for attempt in range(max_attempts):
-                response = requests.get(status_url, headers=self.headers, timeout=30)
+                response = self.session.get(status_url, headers=self.headers, timeout=30)
 
                 if response.status_code != 200:
                     logger.warning(f"Status check failed: {response.status_code}")
@@ -205,7 +224,7 @@ class MinerUClient:
 
             # 下载ZIP文件
             logger.info("Downloading ZIP file...")
-            response = requests.get(zip_url, timeout=60)
+            response = self.session.get(zip_url, timeout=60)
 
             if response.status_code != 200:
                 logger.error(f"Failed to download ZIP: {response.status_code}")
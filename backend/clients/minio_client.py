@@ -2,31 +2,64 @@
 MinIO客户端工具模块
 """
 
-import json
-import os
-from io import StringIO
-from typing import Dict, Any, Optional
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import BinaryIO, Callable, Dict, Any, Iterator, List, Optional, Set
+import orjson
 from minio import Minio
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
-from dotenv import load_dotenv
+from backend.common.cache import TTLCache
+from backend.common.config import config
+from backend.common.storage_keys import (
+    questions_object_key, session_questions_index_key, resume_parse_cache_key, session_object_prefix
+)
 from backend.common.logger import get_logger
 
-load_dotenv()
-
 logger = get_logger(__name__)
 
+# 批量下载时的最大并发数
+MAX_BATCH_DOWNLOAD_WORKERS = 16
+
+# 批量下载/检查共用的线程池（线程按需创建，请求之间复用，不在每次批量操作时新建和销毁线程）
+_batch_executor = ThreadPoolExecutor(max_workers=MAX_BATCH_DOWNLOAD_WORKERS, thread_name_prefix='minio-batch')
+
+# 大文件（PDF等）上传：超过分片大小时自动走分片上传，多个分片并行PUT
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+UPLOAD_PARALLELISM = 4
+
+# 分块读取对象内容时的块大小
+READ_CHUNK_SIZE = 64 * 1024
+
+# 按会话ID命名的旧版会话文件所在前缀
+SESSION_FILE_PREFIXES = ("data/questions_round_", "analysis/qa_complete_")
+
+# 对象不存在时S3返回的错误码
+MISSING_OBJECT_CODES = {"NoSuchKey", "NoSuchObject", "ObjectNotFound"}
+
 
 class MinIOClient:
     """MinIO对象存储客户端"""
 
-    def __init__(self):
-        """初始化MinIO客户端"""
-        # 从环境变量读取配置
-        self.endpoint = os.getenv('MINIO_ENDPOINT', 'test-minio.yeying.pub')
-        self.access_key = os.getenv('MINIO_ACCESS_KEY')
-        self.secret_key = os.getenv('MINIO_SECRET_KEY')
-        self.bucket_name = os.getenv('MINIO_BUCKET', 'yeying-interviewer')
-        self.secure = os.getenv('MINIO_SECURE', 'true').lower() == 'true'
+    def __init__(self, part_size: int = UPLOAD_PART_SIZE, num_parallel_uploads: int = UPLOAD_PARALLELISM):
+        """
+        初始化MinIO客户端
+
+        Args:
+            part_size: 分片上传的分片大小（字节，MinIO要求不小于5MiB）
+            num_parallel_uploads: 分片上传的并发数
+        """
+        self.part_size = part_size
+        self.num_parallel_uploads = num_parallel_uploads
+
+        # 从统一配置读取
+        self.endpoint = config.MINIO_ENDPOINT
+        self.access_key = config.MINIO_ACCESS_KEY
+        self.secret_key = config.MINIO_SECRET_KEY
+        self.bucket_name = config.MINIO_BUCKET
+        self.secure = config.MINIO_SECURE
 
         # 验证必需的配置
         if not self.access_key or not self.secret_key:
@@ -59,11 +92,8 @@ class MinIOClient:
     def upload_json(self, object_name: str, data: Dict[str, Any]) -> bool:
         """上传JSON数据到MinIO"""
         try:
-            json_data = json.dumps(data, ensure_ascii=False, indent=2)
-            json_bytes = json_data.encode('utf-8')
-            
-            # 使用BytesIO而不是StringIO
-            from io import BytesIO
+            # orjson 直接输出 UTF-8 bytes，无需再 encode；不缩进，存储和传输更小
+            json_bytes = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
             data_stream = BytesIO(json_bytes)
             
             # 上传文件
@@ -81,25 +111,88 @@ class MinIOClient:
             logger.error(f"Error uploading {object_name}: {e}")
             return False
     
-    def download_json(self, object_name: str) -> Optional[Dict[str, Any]]:
-        """从MinIO下载JSON数据"""
+    def download_json(self, object_name: str, missing_ok: bool = False) -> Optional[Dict[str, Any]]:
+        """从MinIO下载JSON数据（missing_ok含义同download_bytes）"""
+        # 分块读入预分配缓冲区后直接解析，orjson可直接解析bytearray
+        raw = self._download(object_name, _read_into_buffer, missing_ok)
+        if raw is None:
+            return None
+        return orjson.loads(raw)
+
+    def download_json_many(self, object_names: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        并发下载多个JSON对象
+
+        Args:
+            object_names: 对象名称列表
+
+        Returns:
+            与object_names顺序一致的数据列表，下载或解析失败的位置为None
+        """
+        def load(object_name: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self.download_json(object_name)
+            except Exception as e:
+                logger.error(f"Error loading {object_name}: {e}")
+                return None
+
+        if len(object_names) <= 1:
+            return [load(object_name) for object_name in object_names]
+
+        return list(_batch_executor.map(load, object_names))
+
+    def download_bytes(self, object_name: str, missing_ok: bool = False) -> Optional[bytes]:
+        """
+        从MinIO下载对象原始内容（不做JSON解析）
+
+        Args:
+            object_name: 对象名称
+            missing_ok: 对象不存在属于预期情况时不记录错误日志
+        """
+        return self._download(object_name, lambda response: response.data, missing_ok)
+
+    def _download(self, object_name: str, read: Callable[[Any], Any], missing_ok: bool) -> Optional[Any]:
+        """获取对象并用read读取响应内容，读取完成后释放连接"""
         try:
             response = self.client.get_object(self.bucket_name, object_name)
-            data = json.loads(response.data.decode('utf-8'))
-            return data
+            return read(response)
 
         except S3Error as e:
-            logger.error(f"Error downloading {object_name}: {e}")
+            if not (missing_ok and e.code in MISSING_OBJECT_CODES):
+                logger.error(f"Error downloading {object_name}: {e}")
             return None
         finally:
             if 'response' in locals():
                 response.close()
                 response.release_conn()
-    
+
+    def stream_object(self, object_name: str, chunk_size: int = 32 * 1024) -> '_ObjectStream':
+        """
+        以分块方式读取MinIO对象
+
+        对象不存在等错误在调用时即抛出S3Error；返回的可迭代对象在close()时释放连接
+        （Flask/Werkzeug在响应结束后会自动调用close）。
+
+        Args:
+            object_name: 对象名称
+            chunk_size: 每块字节数
+
+        Returns:
+            对象内容的分块可迭代对象
+        """
+        response = self.client.get_object(self.bucket_name, object_name)
+        return _ObjectStream(response, chunk_size)
+
     def upload_file(self, object_name: str, file_path: str) -> bool:
         """上传本地文件到MinIO"""
         try:
-            self.client.fput_object(self.bucket_name, object_name, file_path)
+            self.client.fput_object(
+                self.bucket_name,
+                object_name,
+                file_path,
+                part_size=self.part_size,
+                num_parallel_uploads=self.num_parallel_uploads
+            )
             logger.info(f"Successfully uploaded {file_path} as {object_name}")
             return True
 
@@ -107,6 +200,26 @@ class MinIOClient:
             logger.error(f"Error uploading {file_path}: {e}")
             return False
     
+    def upload_stream(self, object_name: str, data: BinaryIO, length: int,
+                      content_type: str = 'application/octet-stream') -> bool:
+        """上传文件流到MinIO（无需先落盘）"""
+        try:
+            self.client.put_object(
+                self.bucket_name,
+                object_name,
+                data=data,
+                length=length,
+                content_type=content_type,
+                part_size=self.part_size,
+                num_parallel_uploads=self.num_parallel_uploads
+            )
+            logger.info(f"Successfully uploaded stream as {object_name}")
+            return True
+
+        except S3Error as e:
+            logger.error(f"Error uploading {object_name}: {e}")
+            return False
+
     def download_file(self, object_name: str, file_path: str) -> bool:
         """从MinIO下载文件到本地"""
         try:
@@ -118,15 +231,24 @@ class MinIOClient:
             logger.error(f"Error downloading {object_name}: {e}")
             return False
     
-    def list_objects(self, prefix: str = "") -> list:
-        """列出MinIO中的对象"""
+    def list_objects(self, prefix: str = "", recursive: bool = False) -> list:
+        """列出MinIO中的对象（需要完整列表时使用，仅遍历时用iter_objects）"""
+        return list(self.iter_objects(prefix, recursive))
+
+    def iter_objects(self, prefix: str = "", recursive: bool = False) -> Iterator[str]:
+        """
+        逐个返回MinIO中的对象名称（按页拉取，不一次性构建完整列表）
+
+        Args:
+            prefix: 对象名前缀
+            recursive: 是否列出子"目录"中的对象；为False时只返回prefix下一级
+        """
         try:
-            objects = self.client.list_objects(self.bucket_name, prefix=prefix)
-            return [obj.object_name for obj in objects]
+            for obj in self.client.list_objects(self.bucket_name, prefix=prefix, recursive=recursive):
+                yield obj.object_name
 
         except S3Error as e:
             logger.error(f"Error listing objects: {e}")
-            return []
 
     def object_exists(self, object_name: str) -> bool:
         """检查MinIO对象是否存在"""
@@ -134,11 +256,27 @@ class MinIOClient:
             self.client.stat_object(self.bucket_name, object_name)
             return True
         except S3Error as e:
-            if e.code in {"NoSuchKey", "NoSuchObject", "ObjectNotFound"}:
+            if e.code in MISSING_OBJECT_CODES:
                 return False
             logger.error(f"Error stating object {object_name}: {e}")
             return False
 
+    def existing_objects(self, object_names: List[str]) -> Set[str]:
+        """
+        并发检查多个对象是否存在（每个对象一次HEAD请求）
+
+        Args:
+            object_names: 对象名称列表
+
+        Returns:
+            其中已存在的对象名称集合
+        """
+        if len(object_names) <= 1:
+            return {name for name in object_names if self.object_exists(name)}
+
+        exists = _batch_executor.map(self.object_exists, object_names)
+        return {name for name, found in zip(object_names, exists) if found}
+
     def delete_object(self, object_name: str) -> bool:
         """删除MinIO中的对象"""
         try:
@@ -150,26 +288,60 @@ class MinIOClient:
             logger.error(f"Error deleting {object_name}: {e}")
             return False
 
-    def delete_session_files(self, session_id: str) -> bool:
-        """删除会话相关的所有文件"""
-        try:
-            # 列出所有相关文件
-            objects = self.list_objects()
-            deleted_count = 0
-
-            for obj_name in objects:
-                # 删除题目文件: data/questions_round_*_{session_id}.json
-                if (obj_name.startswith("data/questions_round_") and
-                    obj_name.endswith(f"_{session_id}.json")):
-                    if self.delete_object(obj_name):
-                        deleted_count += 1
-
-                # 删除分析文件: analysis/qa_complete_*_{session_id}.json
-                elif (obj_name.startswith("analysis/qa_complete_") and
-                      obj_name.endswith(f"_{session_id}.json")):
-                    if self.delete_object(obj_name):
-                        deleted_count += 1
+    def delete_objects(self, object_names: List[str]) -> int:
+        """
+        批量删除MinIO中的对象（multi-object delete，每批最多1000个对象只需一次请求）
+
+        Args:
+            object_names: 对象名称列表
+
+        Returns:
+            成功删除的对象数量
+        """
+        if not object_names:
+            return 0
+
+        # remove_objects是惰性的，需遍历返回的错误迭代器才会真正发出请求
+        errors = self.client.remove_objects(
+            self.bucket_name,
+            (DeleteObject(object_name) for object_name in object_names)
+        )
+        failed = 0
+        for error in errors:
+            failed += 1
+            logger.error(f"Error deleting {error.name}: {error.message}")
+
+        return len(object_names) - failed
 
+    def delete_session_files(self, session_id: str, room_id: Optional[str] = None) -> bool:
+        """
+        删除会话相关的所有文件
+
+        Args:
+            session_id: 会话ID
+            room_id: 面试间ID，提供时一并删除rooms/{room_id}/sessions/{session_id}/下的对象（题目文件和会话问题索引）
+        """
+        try:
+            # 按前缀列举（由服务端过滤），再用本次调用编译的一个正则（包含session_id）完整匹配文件名；收集后一次性批量删除
+            #   题目文件: data/questions_round_{round_index}_{session_id}.json
+            #   分析文件: analysis/qa_complete_{round_index}_{session_id}.json
+            session_file = re.compile(
+                rf"(?:{'|'.join(map(re.escape, SESSION_FILE_PREFIXES))})\d+_{re.escape(session_id)}\.json"
+            )
+            to_delete = [
+                obj_name
+                for prefix in SESSION_FILE_PREFIXES
+                for obj_name in self.iter_objects(prefix=prefix)
+                if session_file.fullmatch(obj_name)
+            ]
+            if room_id:
+                session_objects = list(self.iter_objects(prefix=session_object_prefix(room_id, session_id),
+                                                         recursive=True))
+                for obj_name in session_objects:
+                    _questions_cache.delete(obj_name)
+                to_delete.extend(session_objects)
+
+            deleted_count = self.delete_objects(to_delete)
             logger.info(f"Deleted {deleted_count} files for session {session_id}")
             return True
 
@@ -201,8 +373,73 @@ class MinIOClient:
             return None
 
 
-# 全局MinIO客户端实例
-minio_client = MinIOClient()
+def _read_into_buffer(response) -> bytearray:
+    """
+    按Content-Length预分配缓冲区并分块读入响应内容
+
+    response.data会先读出各个分块再拼接成完整bytes，大对象读取时内存中同时存在两份内容；
+    这里逐块写入预分配的缓冲区，峰值只多出一个分块。
+    """
+    length = response.headers.get('Content-Length')
+    if length is None:
+        return bytearray(response.data)
+
+    buffer = bytearray(int(length))
+    offset = 0
+    for chunk in response.stream(READ_CHUNK_SIZE):
+        buffer[offset:offset + len(chunk)] = chunk
+        offset += len(chunk)
+    del buffer[offset:]
+    return buffer
+
+
+class _ObjectStream:
+    """MinIO对象分块读取器，关闭时归还底层连接"""
+
+    def __init__(self, response, chunk_size: int):
+        self._response = response
+        self._chunk_size = chunk_size
+        self._closed = False
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """对象大小（来自响应头，缺失时为None）"""
+        value = self._response.headers.get('Content-Length')
+        return int(value) if value is not None else None
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            yield from self._response.stream(self._chunk_size)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._response.close()
+        self._response.release_conn()
+
+
+# 全局MinIO客户端实例（首次使用时创建，导入模块时不访问MinIO）
+_minio_client = None
+
+
+def get_minio_client() -> MinIOClient:
+    """获取MinIO客户端实例（延迟初始化）"""
+    global _minio_client
+    if _minio_client is None:
+        _minio_client = MinIOClient()
+    return _minio_client
+
+# 简历数据缓存：只在上传时变化，但几乎每个页面都会读取
+_resume_cache = TTLCache(ttl=config.RESUME_CACHE_TTL, maxsize=256)
+
+# 问题数据缓存：轮次题目生成后不再修改
+_questions_cache = TTLCache(ttl=config.QUESTIONS_CACHE_TTL, maxsize=1024)
+
+# 会话问题索引的读-改-写锁（按对象名分段，避免同一会话并发写入互相覆盖）
+_index_locks = [threading.Lock() for _ in range(64)]
 
 
 def upload_resume_data(resume_data: Dict[str, Any], room_id: str) -> bool:
@@ -217,7 +454,12 @@ def upload_resume_data(resume_data: Dict[str, Any], room_id: str) -> bool:
         是否上传成功
     """
     object_name = f"rooms/{room_id}/resume.json"
-    return minio_client.upload_json(object_name, resume_data)
+    success = get_minio_client().upload_json(object_name, resume_data)
+    if success:
+        _resume_cache.set(room_id, resume_data)
+    else:
+        _resume_cache.delete(room_id)
+    return success
 
 
 def download_resume_data(room_id: str) -> Optional[Dict[str, Any]]:
@@ -231,7 +473,35 @@ def download_resume_data(room_id: str) -> Optional[Dict[str, Any]]:
         简历数据，如果不存在返回None
     """
     object_name = f"rooms/{room_id}/resume.json"
-    return minio_client.download_json(object_name)
+    # 并发请求同一简历时只发起一次下载；不缓存缺失结果，保证上传后立即可见
+    return _resume_cache.get_or_load(room_id, lambda: get_minio_client().download_json(object_name))
+
+
+def download_parsed_resume(pdf_digest: str) -> Optional[Dict[str, Any]]:
+    """
+    获取已缓存的简历解析结果
+
+    Args:
+        pdf_digest: 简历PDF内容的SHA-256十六进制摘要
+
+    Returns:
+        解析出的简历数据，未缓存返回None
+    """
+    return get_minio_client().download_json(resume_parse_cache_key(pdf_digest), missing_ok=True)
+
+
+def upload_parsed_resume(resume_data: Dict[str, Any], pdf_digest: str) -> bool:
+    """
+    缓存简历解析结果，同一份PDF再次上传时跳过MinerU解析和大模型提取
+
+    Args:
+        resume_data: 解析出的简历数据
+        pdf_digest: 简历PDF内容的SHA-256十六进制摘要
+
+    Returns:
+        是否上传成功
+    """
+    return get_minio_client().upload_json(resume_parse_cache_key(pdf_digest), resume_data)
 
 
 def upload_questions_data(questions_data: Dict[str, Any], room_id: str, session_id: str, round_index: int) -> bool:
@@ -247,8 +517,13 @@ def upload_questions_data(questions_data: Dict[str, Any], room_id: str, session_
     Returns:
         是否上传成功
     """
-    object_name = f"rooms/{room_id}/sessions/{session_id}/questions/round_{round_index}.json"
-    return minio_client.upload_json(object_name, questions_data)
+    object_name = questions_object_key(room_id, session_id, round_index)
+    success = get_minio_client().upload_json(object_name, questions_data)
+    if success:
+        _questions_cache.set(object_name, questions_data)
+    else:
+        _questions_cache.delete(object_name)
+    return success
 
 
 def download_questions_data(room_id: str, session_id: str, round_index: int) -> Optional[Dict[str, Any]]:
@@ -263,8 +538,100 @@ def download_questions_data(room_id: str, session_id: str, round_index: int) ->
     Returns:
         问题数据，如果不存在返回None
     """
-    object_name = f"rooms/{room_id}/sessions/{session_id}/questions/round_{round_index}.json"
-    return minio_client.download_json(object_name)
+    return download_questions_data_by_keys([questions_object_key(room_id, session_id, round_index)])[0]
+
+
+def download_questions_data_by_keys(object_names: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """
+    批量下载问题数据（缓存未命中的部分并发从MinIO获取）
+
+    Args:
+        object_names: 问题数据对象名称列表（即Round.questions_file_path）
+
+    Returns:
+        与object_names顺序一致的问题数据列表，不存在的位置为None
+    """
+    results = [_questions_cache.get(object_name) for object_name in object_names]
+
+    missing = [i for i, data in enumerate(results) if data is None]
+    if missing:
+        downloaded = get_minio_client().download_json_many([object_names[i] for i in missing])
+        for i, data in zip(missing, downloaded):
+            if data is not None:
+                _questions_cache.set(object_names[i], data)
+            results[i] = data
+
+    return results
+
+
+def merge_session_questions_index(questions_data: Dict[str, Any], room_id: str, session_id: str,
+                                  round_index: int) -> bool:
+    """
+    将一轮问题数据合并进会话问题索引
+
+    索引汇总会话所有轮次的题目，会话详情页只需一次GET即可取得全部轮次。
+    MinIO不支持条件写入，这里以进程内锁串行化同一会话的读-改-写；
+    同一会话的轮次按顺序生成，跨进程并发写入同一索引的情况可以忽略。
+
+    Args:
+        questions_data: 问题数据
+        room_id: 面试间ID
+        session_id: 会话ID
+        round_index: 轮次索引
+
+    Returns:
+        是否写入成功
+    """
+    object_name = session_questions_index_key(room_id, session_id)
+    with _index_locks[hash(object_name) % len(_index_locks)]:
+        raw = get_minio_client().download_bytes(object_name, missing_ok=True)
+        index = orjson.loads(raw) if raw else {'room_id': room_id, 'session_id': session_id, 'rounds': {}}
+        index['rounds'][str(round_index)] = questions_data
+
+        success = get_minio_client().upload_json(object_name, index)
+        if success:
+            _questions_cache.set(object_name, index)
+        else:
+            _questions_cache.delete(object_name)
+        return success
+
+
+def download_session_questions(room_id: str, session_id: str, rounds: List[Any]) -> List[Optional[Dict[str, Any]]]:
+    """
+    获取会话各轮次的问题数据
+
+    优先读取会话问题索引（一次GET），索引不存在或缺少某轮时回退到该轮的单独文件。
+
+    Args:
+        room_id: 面试间ID
+        session_id: 会话ID
+        rounds: 该会话的Round记录列表
+
+    Returns:
+        与rounds顺序一致的问题数据列表，不存在的位置为None
+    """
+    if not rounds:
+        return []
+
+    object_name = session_questions_index_key(room_id, session_id)
+    index = _questions_cache.get_or_load(
+        object_name, lambda: get_minio_client().download_json(object_name, missing_ok=True)
+    )
+    indexed_rounds = index.get('rounds', {}) if index else {}
+
+    results = []
+    for round_obj in rounds:
+        data = indexed_rounds.get(str(round_obj.round_index))
+        # 轮次删除后索引号可能被复用，以round_id校验条目是否属于当前轮次
+        results.append(data if data and data.get('round_id') == round_obj.id else None)
+
+    missing = [i for i, data in enumerate(results) if data is None]
+    if missing:
+        fallback = download_questions_data_by_keys([rounds[i].questions_file_path for i in missing])
+        for i, data in zip(missing, fallback):
+            results[i] = data
+
+    return results
 
 
 def upload_qa_analysis(analysis_data: Dict[str, Any], room_id: str, session_id: str, round_index: int) -> bool:
@@ -281,7 +648,7 @@ def upload_qa_analysis(analysis_data: Dict[str, Any], room_id: str, session_id:
         是否上传成功
     """
     object_name = f"rooms/{room_id}/sessions/{session_id}/analysis/qa_complete_{round_index}.json"
-    return minio_client.upload_json(object_name, analysis_data)
+    return get_minio_client().upload_json(object_name, analysis_data)
 
 
 def download_qa_analysis(room_id: str, session_id: str, round_index: int) -> Optional[Dict[str, Any]]:
@@ -297,7 +664,7 @@ def download_qa_analysis(room_id: str, session_id: str, round_index: int) -> Opt
         分析数据，如果不存在返回None
     """
     object_name = f"rooms/{room_id}/sessions/{session_id}/analysis/qa_complete_{round_index}.json"
-    return minio_client.download_json(object_name)
+    return get_minio_client().download_json(object_name)
 
 
 def upload_evaluation_report(report_data: Dict[str, Any], room_id: str, session_id: str, round_index: int) -> bool:
@@ -314,7 +681,7 @@ def upload_evaluation_report(report_data: Dict[str, Any], room_id: str, session_
         是否上传成功
     """
     object_name = f"rooms/{room_id}/sessions/{session_id}/reports/evaluation_{round_index}.json"
-    return minio_client.upload_json(object_name, report_data)
+    return get_minio_client().upload_json(object_name, report_data)
 
 
 def download_evaluation_report(room_id: str, session_id: str, round_index: int) -> Optional[Dict[str, Any]]:
@@ -330,7 +697,7 @@ def download_evaluation_report(room_id: str, session_id: str, round_index: int)
         报告数据，如果不存在返回None
     """
     object_name = f"rooms/{room_id}/sessions/{session_id}/reports/evaluation_{round_index}.json"
-    return minio_client.download_json(object_name)
+    return get_minio_client().download_json(object_name)
 
 
 def upload_pdf_report(pdf_file_path: str, room_id: str, session_id: str, round_index: int) -> bool:
@@ -347,7 +714,7 @@ def upload_pdf_report(pdf_file_path: str, room_id: str, session_id: str, round_i
         是否上传成功
     """
     object_name = f"rooms/{room_id}/sessions/{session_id}/reports/report_{round_index}.pdf"
-    return minio_client.upload_file(object_name, pdf_file_path)
+    return get_minio_client().upload_file(object_name, pdf_file_path)
 
 
 def download_pdf_report_url(room_id: str, session_id: str, round_index: int, expires_hours: int = 24) -> Optional[str]:
@@ -364,4 +731,4 @@ def download_pdf_report_url(room_id: str, session_id: str, round_index: int, exp
         预签名URL，如果文件不存在返回None
     """
     object_name = f"rooms/{room_id}/sessions/{session_id}/reports/report_{round_index}.pdf"
-    return minio_client.get_presigned_url(object_name, expires_hours)
\ No newline at end of file
+    return get_minio_client().get_presigned_url(object_name, expires_hours)
\ No newline at end of file
@@ -3,15 +3,13 @@ RAG 服务客户端
 负责与 Yeying-RAG 服务进行交互
 """
 
-import os
-import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional, List
-from dotenv import load_dotenv
+from backend.common.config import config
 from backend.common.logger import get_logger
 
-load_dotenv()
-
 logger = get_logger(__name__)
 
 
@@ -20,14 +18,36 @@ class RAGClient:
 
     def __init__(self):
         """初始化 RAG 客户端"""
-        self.api_url = os.getenv('RAG_API_URL', 'http://localhost:8000')
-        self.timeout = int(os.getenv('RAG_TIMEOUT', '30'))
+        self.api_url = config.RAG_API_URL
+        self.timeout = config.RAG_TIMEOUT
 
         if not self.api_url:
             raise ValueError("RAG_API_URL not configured in environment variables")
 
+        # 复用连接池：保持keep-alive，避免每次调用都重新建立TCP/TLS连接
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Content-Type': 'application/json'})
+
         logger.info(f"RAG Client initialized with API URL: {self.api_url}")
 
+    def _post(self, url: str, payload: Dict[str, Any]) -> requests.Response:
+        """以orjson序列化请求体发送POST请求，非2xx状态抛出HTTPError"""
+        response = self.session.post(url, data=orjson.dumps(payload), timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    def _post_json(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """发送POST请求并以orjson解析响应体"""
+        response = self._post(url, payload)
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            # 与 response.json() 一致，解析失败归为 RequestException，由调用方统一处理
+            raise requests.exceptions.InvalidJSONError(str(e), response=response)
+
     def create_memory(self, app: str = "interviewer", params: Optional[Dict[str, Any]] = None) -> str:
         """
         创建新的记忆体
@@ -46,10 +66,7 @@ class RAGClient:
                 "params": params or {}
             }
 
-            response = requests.post(url, json=payload, timeout=self.timeout)
-            response.raise_for_status()
-
-            result = response.json()
+            result = self._post_json(url, payload)
             memory_id = result.get('memory_id')
 
             if not memory_id:
@@ -103,10 +120,7 @@ class RAGClient:
                 "max_chars": max_chars
             }
 
-            response = requests.post(url, json=payload, timeout=self.timeout)
-            response.raise_for_status()
-
-            result = response.json()
+            result = self._post_json(url, payload)
             questions = result.get('questions', [])
 
             if not questions:
@@ -152,10 +166,7 @@ class RAGClient:
                 "content": content
             }
 
-            response = requests.post(url, json=payload, timeout=self.timeout)
-            response.raise_for_status()
-
-            result = response.json()
+            result = self._post_json(url, payload)
             jd_id = result.get('jd_id')
 
             if not jd_id:
@@ -196,10 +207,7 @@ class RAGClient:
                 "description": description
             }
 
-            response = requests.post(api_url, json=payload, timeout=self.timeout)
-            response.raise_for_status()
-
-            result = response.json()
+            result = self._post_json(api_url, payload)
             logger.info(f"Pushed message to RAG memory {memory_id}: {url}")
 
             return result
@@ -233,8 +241,7 @@ class RAGClient:
                 "url": url
             }
 
-            response = requests.post(api_url, json=payload, timeout=self.timeout)
-            response.raise_for_status()
+            self._post(api_url, payload)
 
             logger.info(f"Deleted message from RAG memory {memory_id}: {url}")
             return True
@@ -265,10 +272,7 @@ class RAGClient:
                 "app": app
             }
 
-            response = requests.post(api_url, json=payload, timeout=self.timeout)
-            response.raise_for_status()
-
-            result = response.json()
+            result = self._post_json(api_url, payload)
             deleted = result.get('deleted', 0)
 
             logger.info(f"Cleared RAG memory {memory_id}: {deleted} messages deleted")
@@ -0,0 +1,33 @@
+"""
+时间工具模块
+提供高频调用场景下的时间戳生成
+"""
+
+import threading
+import time
+from datetime import datetime
+
+# 同一毫秒内复用已格式化的时间字符串
+_CACHE_WINDOW_NS = 1_000_000
+
+_local = threading.local()
+
+
+def now_iso() -> str:
+    """
+    获取当前本地时间的ISO格式字符串（等价于 datetime.now().isoformat()）
+
+    每个线程缓存最近一次的格式化结果，同一毫秒内的重复调用直接复用，
+    避免在响应封装等热点路径上反复创建datetime并格式化。
+
+    Returns:
+        ISO格式时间字符串
+    """
+    now_ns = time.time_ns()
+    cached = getattr(_local, 'cached', None)
+    if cached is not None and 0 <= now_ns - cached[0] < _CACHE_WINDOW_NS:
+        return cached[1]
+
+    value = datetime.fromtimestamp(now_ns / 1e9).isoformat()
+    _local.cached = (now_ns, value)
+    return value
@@ -1,64 +1,93 @@
 """
 统一配置管理模块
-采用单例模式，集中管理所有配置项
+模块级单一实例，集中管理所有配置项
 """
 
 import os
+from dataclasses import dataclass
 from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
 class Config:
-    """应用配置类（单例模式）"""
-
-    _instance: Optional['Config'] = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-
-    def __init__(self):
-        """初始化配置（仅执行一次）"""
-        if self._initialized:
-            return
-
-        # Flask配置
-        self.SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-please-change-in-production')
-        self.FLASK_DEBUG = os.getenv('FLASK_DEBUG', 'False').lower() in ('true', '1', 'yes')
-        self.LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
-
-        # 数据库配置
-        self.DATABASE_PATH = os.getenv('DATABASE_PATH', 'data/yeying_interviewer.db')
-
-        # Qwen API配置
-        self.QWEN_BASE_URL = os.getenv('QWEN_BASE_URL', 'https://dashscope.aliyuncs.com/compatible-mode/v1')
-        self.QWEN_API_KEY = os.getenv('QWEN_API_KEY') or os.getenv('API_KEY')
-        self.MODEL_NAME = os.getenv('MODEL_NAME', 'qwen-turbo')
-
-        # MinerU API配置
-        self.MINERU_API_KEY = os.getenv('MINERU_API_KEY')
-        self.MINERU_API_URL = os.getenv('MINERU_API_URL', 'https://mineru.net/api/v4')
-
-        # MinIO配置
-        self.MINIO_ENDPOINT = os.getenv('MINIO_ENDPOINT', 'test-minio.yeying.pub')
-        self.MINIO_ACCESS_KEY = os.getenv('MINIO_ACCESS_KEY')
-        self.MINIO_SECRET_KEY = os.getenv('MINIO_SECRET_KEY')
-        self.MINIO_BUCKET = os.getenv('MINIO_BUCKET', 'yeying-interviewer')
-        self.MINIO_SECURE = os.getenv('MINIO_SECURE', 'true').lower() == 'true'
-
-        # DigitalHub配置
-        self.PUBLIC_HOST = os.getenv('PUBLIC_HOST')
-        self.LLM_PORT = int(os.getenv('LLM_PORT', '8011'))
-
-        # 应用配置
-        self.APP_HOST = os.getenv('APP_HOST', '0.0.0.0')
-        self.APP_PORT = int(os.getenv('APP_PORT', '8080'))
-
-        self._initialized = True
+    """应用配置类（不可变，进程启动时由环境变量构建一次）"""
+
+    # Flask配置
+    SECRET_KEY: str
+    FLASK_DEBUG: bool
+    LOG_LEVEL: str
+
+    # 数据库配置
+    DATABASE_PATH: str
+
+    # Qwen API配置
+    QWEN_BASE_URL: str
+    QWEN_API_KEY: Optional[str]
+    MODEL_NAME: str
+
+    # MinerU API配置
+    MINERU_API_KEY: Optional[str]
+    MINERU_API_URL: str
+
+    # MinIO配置
+    MINIO_ENDPOINT: str
+    MINIO_ACCESS_KEY: Optional[str]
+    MINIO_SECRET_KEY: Optional[str]
+    MINIO_BUCKET: str
+    MINIO_SECURE: bool
+
+    # MinIO读缓存有效期（秒）
+    RESUME_CACHE_TTL: float
+    QUESTIONS_CACHE_TTL: float
+
+    # RAG服务配置
+    RAG_API_URL: str
+    RAG_TIMEOUT: int
+
+    # DigitalHub配置
+    PUBLIC_HOST: Optional[str]
+    LLM_PORT: int
+    # DigitalHub回调签名密钥
+    WEBHOOK_SECRET: Optional[str]
+
+    # 应用配置
+    APP_HOST: str
+    APP_PORT: int
+    # uvicorn工作进程数（报告任务状态保存在数据库中各进程共享；认证challenge、缓存等仍为进程内状态，多进程部署需谨慎）
+    APP_WORKERS: int
+
+    @classmethod
+    def from_env(cls) -> 'Config':
+        """从环境变量读取配置"""
+        return cls(
+            SECRET_KEY=os.getenv('SECRET_KEY', 'dev-secret-key-please-change-in-production'),
+            FLASK_DEBUG=os.getenv('FLASK_DEBUG', 'False').lower() in ('true', '1', 'yes'),
+            LOG_LEVEL=os.getenv('LOG_LEVEL', 'INFO').upper(),
+            DATABASE_PATH=os.getenv('DATABASE_PATH', 'data/yeying_interviewer.db'),
+            QWEN_BASE_URL=os.getenv('QWEN_BASE_URL', 'https://dashscope.aliyuncs.com/compatible-mode/v1'),
+            QWEN_API_KEY=os.getenv('QWEN_API_KEY') or os.getenv('API_KEY'),
+            MODEL_NAME=os.getenv('MODEL_NAME', 'qwen-turbo'),
+            MINERU_API_KEY=os.getenv('MINERU_API_KEY'),
+            MINERU_API_URL=os.getenv('MINERU_API_URL', 'https://mineru.net/api/v4'),
+            MINIO_ENDPOINT=os.getenv('MINIO_ENDPOINT', 'test-minio.yeying.pub'),
+            MINIO_ACCESS_KEY=os.getenv('MINIO_ACCESS_KEY'),
+            MINIO_SECRET_KEY=os.getenv('MINIO_SECRET_KEY'),
+            MINIO_BUCKET=os.getenv('MINIO_BUCKET', 'yeying-interviewer'),
+            MINIO_SECURE=os.getenv('MINIO_SECURE', 'true').lower() == 'true',
+            RESUME_CACHE_TTL=float(os.getenv('RESUME_CACHE_TTL', '60')),
+            QUESTIONS_CACHE_TTL=float(os.getenv('QUESTIONS_CACHE_TTL', '300')),
+            RAG_API_URL=os.getenv('RAG_API_URL', 'http://localhost:8000'),
+            RAG_TIMEOUT=int(os.getenv('RAG_TIMEOUT', '30')),
+            PUBLIC_HOST=os.getenv('PUBLIC_HOST'),
+            LLM_PORT=int(os.getenv('LLM_PORT', '8011')),
+            WEBHOOK_SECRET=os.getenv('WEBHOOK_SECRET'),
+            APP_HOST=os.getenv('APP_HOST', '0.0.0.0'),
+            APP_PORT=int(os.getenv('APP_PORT', '8080')),
+            APP_WORKERS=int(os.getenv('APP_WORKERS', '1')),
+        )
 
     def validate(self) -> tuple[bool, list[str]]:
         """
@@ -108,4 +137,4 @@ class Config:
 
 
 # 全局配置实例
-config = Config()
+config = Config.from_env()
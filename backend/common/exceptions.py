@@ -20,7 +20,7 @@ class ValidationError(BusinessBaseException):
         super().__init__(message, code=400)
 
 
-class ResourceNotFoundError(BaseException):
+class ResourceNotFoundError(BusinessBaseException):
     """资源不存在异常"""
 
     def __init__(self, resource: str = "资源"):
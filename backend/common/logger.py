@@ -2,8 +2,10 @@
 日志配置模块 - 提供统一的日志记录功能，支持rotation
 """
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
 from pathlib import Path
 
@@ -14,7 +16,7 @@ def setup_logger(name: str, log_file: str = None, level=None):
 
     Args:
         name: logger名称，通常使用模块名 __name__
-        log_file: 日志文件路径，如果为None则使用默认路径
+        log_file: 日志文件路径，如果为None则从环境变量LOG_FILE读取，默认logs/interviewer.log
         level: 日志级别，如果为None则从环境变量LOG_LEVEL读取，默认INFO
 
     Returns:
@@ -35,6 +37,8 @@ def setup_logger(name: str, log_file: str = None, level=None):
     logger.setLevel(level)
 
     # 创建日志目录
+    if log_file is None:
+        log_file = os.getenv('LOG_FILE')
     if log_file is None:
         log_dir = Path(__file__).parent.parent.parent / 'logs'
         log_dir.mkdir(exist_ok=True)
@@ -83,3 +87,23 @@ def get_logger(name: str):
         logger实例
     """
     return setup_logger(name)
+
+
+def create_queue_handler(*handlers: logging.Handler) -> QueueHandler:
+    """
+    创建异步日志处理器
+
+    返回的QueueHandler只把日志记录放入队列，由后台线程交给handlers写入，
+    避免在请求线程中执行文件写入和rotation。进程退出时自动停止后台线程并刷新队列。
+
+    Args:
+        handlers: 实际执行输出的处理器（如RotatingFileHandler）
+
+    Returns:
+        可直接添加到logger上的QueueHandler
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return QueueHandler(log_queue)
@@ -3,6 +3,7 @@
 提供统一的异常处理、日志记录、请求验证等中间件
 """
 
+import logging
 from functools import wraps
 from typing import Callable, Any, Tuple
 from flask import request, Flask, Response
@@ -24,7 +25,7 @@ def error_handler(app: Flask) -> None:
     @app.errorhandler(BusinessBaseException)
     def handle_custom_exception(error):
         """处理自定义异常"""
-        logger.warning(f"Business exception: {error.message}", exc_info=True)
+        logger.warning("Business exception: %s", error.message)
         return ApiResponse.error(
             message=error.message,
             code=error.code
@@ -33,13 +34,13 @@ def error_handler(app: Flask) -> None:
     @app.errorhandler(ValueError)
     def handle_value_error(error):
         """处理值错误"""
-        logger.warning(f"ValueError: {str(error)}", exc_info=True)
+        logger.warning("ValueError: %s", error)
         return ApiResponse.bad_request(str(error))
 
     @app.errorhandler(404)
     def handle_not_found(error):
-        """处理404错误"""
-        logger.warning(f"404 Not Found: {request.url}")
+        """处理404错误（包括路由中<uuid:...>等参数格式不合法的请求）"""
+        logger.warning("404 Not Found: %s", request.url)
         return ApiResponse.not_found("页面或资源")
 
     @app.errorhandler(500)
@@ -66,19 +67,17 @@ def request_logger(app: Flask) -> None:
     @app.before_request
     def log_request():
         """记录请求信息"""
-        logger.info(
-            f"Request: {request.method} {request.path} "
-            f"from {request.remote_addr} "
-            f"User-Agent: {request.user_agent}"
-        )
+        # 日志级别高于INFO时不访问user_agent（Werkzeug会解析UA头）
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Request: %s %s from %s User-Agent: %s",
+                request.method, request.path, request.remote_addr, request.user_agent
+            )
 
     @app.after_request
     def log_response(response: Response) -> Response:
         """记录响应信息"""
-        logger.info(
-            f"Response: {request.method} {request.path} "
-            f"Status: {response.status_code}"
-        )
+        logger.info("Response: %s %s Status: %s", request.method, request.path, response.status_code)
         return response
 
 
@@ -104,14 +103,11 @@ def validate_request(*required_fields: str) -> Callable:
             else:
                 data = request.form.to_dict()
 
-            # 检查必需字段
-            missing_fields = []
-            for field in required_fields:
-                if field not in data or not data[field]:
-                    missing_fields.append(field)
+            # 检查必需字段（缺失或为空值均视为缺失，保持声明顺序以便提示信息稳定）
+            missing_fields = [field for field in required_fields if not data.get(field)]
 
             if missing_fields:
-                logger.warning(f"Missing required fields: {missing_fields}")
+                logger.warning("Missing required fields: %s", missing_fields)
                 return ApiResponse.bad_request(
                     f"缺少必需参数: {', '.join(missing_fields)}"
                 )
@@ -136,7 +132,7 @@ def handle_exceptions(f: Callable) -> Callable:
         try:
             return f(*args, **kwargs)
         except BusinessBaseException as e:
-            logger.warning(f"Business exception in {f.__name__}: {e.message}")
+            logger.warning("Business exception in %s: %s", f.__name__, e.message)
             return ApiResponse.error(message=e.message, code=e.code)
         except Exception as e:
             logger.error(f"Unexpected error in {f.__name__}: {str(e)}", exc_info=True)
@@ -3,15 +3,18 @@
 提供标准化的API响应格式
 """
 
-from typing import Any, Optional, Tuple
-from flask import jsonify
-from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+import orjson
+from flask import Response, current_app, g, has_request_context, stream_with_context
+from backend.common.clock import now_iso
 
 
 class ResponseCode:
     """响应状态码枚举"""
     SUCCESS = 200
     CREATED = 201
+    ACCEPTED = 202
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
     FORBIDDEN = 403
@@ -19,6 +22,42 @@ class ResponseCode:
     INTERNAL_ERROR = 500
 
 
+def _response_timestamp() -> str:
+    """响应时间戳：请求内首次使用时生成并绑定到g，同一请求的后续响应直接复用"""
+    if not has_request_context():
+        return now_iso()
+    timestamp = g.get('_response_timestamp')
+    if timestamp is None:
+        timestamp = g._response_timestamp = now_iso()
+    return timestamp
+
+
+@lru_cache(maxsize=256)
+def _envelope_prefix(success: bool, code: int, message: str) -> bytes:
+    """响应体中data之前的部分（同一结果、状态码和消息只序列化一次）"""
+    return (
+        (b'{"success":true,"code":' if success else b'{"success":false,"code":')
+        + str(code).encode() + b',"message":' + orjson.dumps(message) + b',"data":'
+    )
+
+
+def _envelope_response(success: bool, code: int, message: str, data: Any) -> Response:
+    """
+    按模板拼接统一格式的JSON响应体，不构造中间字典
+
+    data使用与应用JSON provider相同的default函数序列化，输出与序列化完整字典一致。
+    """
+    if data is None:
+        data_bytes = b'null'
+    else:
+        data_bytes = orjson.dumps(data, default=current_app.json.default, option=orjson.OPT_NON_STR_KEYS)
+    body = (
+        _envelope_prefix(success, code, str(message)) + data_bytes
+        + b',"timestamp":' + orjson.dumps(_response_timestamp()) + b'}'
+    )
+    return current_app.response_class(body, mimetype='application/json')
+
+
 class ApiResponse:
     """统一API响应格式"""
 
@@ -35,14 +74,37 @@ class ApiResponse:
         Returns:
             Flask JSON响应
         """
-        response = {
-            'success': True,
-            'code': code,
-            'message': message,
-            'data': data,
-            'timestamp': datetime.now().isoformat()
-        }
-        return jsonify(response), code
+        return _envelope_response(True, code, message, data), code
+
+    @staticmethod
+    def success_stream(items: Iterable[Any], serializer: Optional[Callable[[Any], Any]] = None,
+                       message: str = "操作成功", code: int = ResponseCode.SUCCESS) -> Tuple[Response, int]:
+        """
+        成功响应（流式输出列表数据）
+
+        逐条序列化并输出data数组中的元素，不在内存中同时持有完整的字典列表和JSON文本。
+
+        Args:
+            items: 待输出的对象序列
+            serializer: 将单个对象转换为可序列化数据的函数，为None时直接输出元素
+            message: 响应消息
+            code: HTTP状态码
+
+        Returns:
+            Flask流式JSON响应
+        """
+        # 与_envelope_response使用相同的default和选项，避免响应头发出后才在中途序列化失败
+        default = current_app.json.default
+
+        def generate() -> Iterator[bytes]:
+            yield _envelope_prefix(True, code, str(message)) + b'['
+            for index, item in enumerate(items):
+                chunk = orjson.dumps(serializer(item) if serializer else item,
+                                     default=default, option=orjson.OPT_NON_STR_KEYS)
+                yield chunk if index == 0 else b',' + chunk
+            yield b'],"timestamp":' + orjson.dumps(_response_timestamp()) + b'}\n'
+
+        return Response(stream_with_context(generate()), mimetype='application/json'), code
 
     @staticmethod
     def error(message: str, code: int = ResponseCode.BAD_REQUEST, data: Any = None) -> Tuple[dict, int]:
@@ -57,14 +119,7 @@ class ApiResponse:
         Returns:
             Flask JSON响应
         """
-        response = {
-            'success': False,
-            'code': code,
-            'message': message,
-            'data': data,
-            'timestamp': datetime.now().isoformat()
-        }
-        return jsonify(response), code
+        return _envelope_response(False, code, message, data), code
 
     @staticmethod
     def not_found(resource: str = "资源") -> Tuple[dict, int]:
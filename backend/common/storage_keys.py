@@ -0,0 +1,24 @@
+"""
+对象存储路径模块
+集中定义MinIO中各类数据的对象名称，供客户端与服务层共用（不依赖MinIO连接）
+"""
+
+
+def session_object_prefix(room_id: str, session_id: str) -> str:
+    """会话下所有对象的名称前缀（删除会话时按此前缀清理）"""
+    return f"rooms/{room_id}/sessions/{session_id}/"
+
+
+def questions_object_key(room_id: str, session_id: str, round_index: int) -> str:
+    """轮次问题数据在MinIO中的对象名称"""
+    return f"{session_object_prefix(room_id, session_id)}questions/round_{round_index}.json"
+
+
+def session_questions_index_key(room_id: str, session_id: str) -> str:
+    """会话问题索引（汇总该会话所有轮次题目）在MinIO中的对象名称"""
+    return f"{session_object_prefix(room_id, session_id)}questions/index.json"
+
+
+def resume_parse_cache_key(pdf_digest: str) -> str:
+    """简历解析结果缓存（按PDF内容的SHA-256）在MinIO中的对象名称"""
+    return f"cache/resume/{pdf_digest}.json"
@@ -5,7 +5,8 @@ API控制器
 
 import hashlib
 import hmac
-import os
+import orjson
+import uuid
 from datetime import datetime
 from flask import Blueprint, request
 from typing import Tuple
@@ -16,8 +17,8 @@ from backend.services.interview_service import (
     RoundCompletionService
 )
 from backend.common.response import ApiResponse, ResponseCode
-from backend.common.validators import validate_uuid_param
-from backend.clients.minio_client import minio_client, download_resume_data
+from backend.clients.minio_client import get_minio_client, download_resume_data
+from backend.common.config import config
 from backend.common.logger import get_logger
 
 logger = get_logger(__name__)
@@ -25,11 +26,19 @@ logger = get_logger(__name__)
 # 创建API蓝图
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
+# 回调签名密钥（启动时编码一次）
+_WEBHOOK_KEY = (config.WEBHOOK_SECRET or '').encode('utf-8')
 
-def verify_signature(req) -> bool:
-    """验证请求签名"""
-    secret = os.getenv("WEBHOOK_SECRET")
-    if not secret:
+
+def verify_signature(req, body: bytes) -> bool:
+    """
+    验证请求签名
+
+    Args:
+        req: 请求对象
+        body: 原始请求体（由调用方读取一次，验证与解析共用）
+    """
+    if not _WEBHOOK_KEY:
         logger.error("WEBHOOK_SECRET 未配置，无法验证签名")
         return False
 
@@ -38,21 +47,21 @@ def verify_signature(req) -> bool:
         logger.warning("缺少 X-DH-Signature 请求头")
         return False
 
-    body_bytes = req.get_data(cache=True)
+    # 按32字节原始摘要比较（兼容带 sha256= 前缀的签名头）
     try:
-        body_text = body_bytes.decode('utf-8')
-    except UnicodeDecodeError:
-        body_text = body_bytes.decode('utf-8', errors='replace')
-
-    message = f"{req.method.upper()}{req.path}{body_text}".encode('utf-8')
-    expected_signature = hmac.new(
-        secret.encode('utf-8'),
-        message,
-        hashlib.sha256
-    ).hexdigest()
-
-    if not hmac.compare_digest(expected_signature, signature):
-        logger.warning("签名验证失败: expected=%s, received=%s", expected_signature, signature)
+        received = bytes.fromhex(signature.removeprefix('sha256='))
+    except ValueError:
+        logger.warning("签名格式无效: %s", signature)
+        return False
+
+    # 签名内容为 METHOD + PATH + body，分段送入HMAC，不拼接也不解码请求体
+    mac = hmac.new(_WEBHOOK_KEY, None, hashlib.sha256)
+    mac.update(req.method.upper().encode('ascii'))
+    mac.update(req.path.encode('utf-8'))
+    mac.update(body)
+
+    if not hmac.compare_digest(mac.digest(), received):
+        logger.warning("签名验证失败: expected=%s, received=%s", mac.hexdigest(), signature)
         return False
 
     return True
@@ -64,19 +73,17 @@ def verify_signature(req) -> bool:
 def get_rooms() -> Tuple[dict, int]:
     """获取所有面试间"""
     try:
-        rooms = RoomService.get_all_rooms()
-        return ApiResponse.success(data=[RoomService.to_dict(r) for r in rooms])
+        return ApiResponse.success_stream(RoomService.get_room_list())
     except Exception as e:
         logger.error(f"Failed to get rooms: {e}", exc_info=True)
         return ApiResponse.internal_error()
 
 
-@api_bp.route('/rooms/<room_id>', methods=['DELETE'])
-@validate_uuid_param('room_id')
-def delete_room(room_id: str) -> Tuple[dict, int]:
+@api_bp.route('/rooms/<uuid:room_id>', methods=['DELETE'])
+def delete_room(room_id: uuid.UUID) -> Tuple[dict, int]:
     """删除面试间"""
     try:
-        success = RoomService.delete_room(room_id)
+        success = RoomService.delete_room(str(room_id))
         if success:
             return ApiResponse.success(message='面试间删除成功')
         return ApiResponse.not_found("面试间")
@@ -87,24 +94,21 @@ def delete_room(room_id: str) -> Tuple[dict, int]:
 
 # ==================== Session API ====================
 
-@api_bp.route('/sessions/<room_id>', methods=['GET'])
-@validate_uuid_param('room_id')
-def get_sessions(room_id: str) -> Tuple[dict, int]:
+@api_bp.route('/sessions/<uuid:room_id>', methods=['GET'])
+def get_sessions(room_id: uuid.UUID) -> Tuple[dict, int]:
     """获取指定面试间的所有会话"""
     try:
-        sessions = SessionService.get_sessions_by_room(room_id)
-        return ApiResponse.success(data=[SessionService.to_dict(s) for s in sessions])
+        return ApiResponse.success_stream(SessionService.get_session_list(str(room_id)))
     except Exception as e:
         logger.error(f"Failed to get sessions: {e}", exc_info=True)
         return ApiResponse.internal_error()
 
 
-@api_bp.route('/sessions/<session_id>', methods=['DELETE'])
-@validate_uuid_param('session_id')
-def delete_session(session_id: str) -> Tuple[dict, int]:
+@api_bp.route('/sessions/<uuid:session_id>', methods=['DELETE'])
+def delete_session(session_id: uuid.UUID) -> Tuple[dict, int]:
     """删除面试会话"""
     try:
-        success = SessionService.delete_session(session_id)
+        success = SessionService.delete_session(str(session_id))
         if success:
             return ApiResponse.success(message='面试会话删除成功')
         return ApiResponse.not_found("面试会话")
@@ -115,13 +119,11 @@ def delete_session(session_id: str) -> Tuple[dict, int]:
 
 # ==================== Round API ====================
 
-@api_bp.route('/rounds/<session_id>', methods=['GET'])
-@validate_uuid_param('session_id')
-def get_rounds(session_id: str) -> Tuple[dict, int]:
+@api_bp.route('/rounds/<uuid:session_id>', methods=['GET'])
+def get_rounds(session_id: uuid.UUID) -> Tuple[dict, int]:
     """获取指定会话的所有轮次"""
     try:
-        rounds = RoundService.get_rounds_by_session(session_id)
-        return ApiResponse.success(data=[RoundService.to_dict(r) for r in rounds])
+        return ApiResponse.success_stream(RoundService.get_round_list(str(session_id)))
     except Exception as e:
         logger.error(f"Failed to get rounds: {e}", exc_info=True)
         return ApiResponse.internal_error()
@@ -130,7 +132,15 @@ def get_rounds(session_id: str) -> Tuple[dict, int]:
 @api_bp.post('/rounds/complete')
 def complete_round_webhook() -> Tuple[dict, int]:
     """处理数字人轮次完成的回调"""
-    payload = request.get_json(silent=True)
+    # 先用原始字节验证签名，通过后再解析JSON，签名错误的请求不产生解析开销
+    raw_body = request.get_data(cache=True)
+    if not verify_signature(request, raw_body):
+        return ApiResponse.error('签名验证失败', code=ResponseCode.UNAUTHORIZED)
+
+    try:
+        payload = orjson.loads(raw_body)
+    except orjson.JSONDecodeError:
+        payload = None
 
     if not isinstance(payload, dict):
         return ApiResponse.bad_request('请求体必须为JSON对象')
@@ -140,9 +150,6 @@ def complete_round_webhook() -> Tuple[dict, int]:
     if missing_fields:
         return ApiResponse.bad_request(f"缺少必要字段: {', '.join(missing_fields)}")
 
-    if not verify_signature(request):
-        return ApiResponse.error('签名验证失败', code=ResponseCode.UNAUTHORIZED)
-
     room_id = str(payload['room_id'])
     session_id = str(payload['session_id'])
     round_index_raw = payload['round_index']
@@ -165,7 +172,7 @@ def complete_round_webhook() -> Tuple[dict, int]:
         return ApiResponse.bad_request('occurred_at 格式不正确')
 
     try:
-        occurred_at = datetime.fromisoformat(occurred_at_raw.replace('Z', '+00:00'))
+        occurred_at = datetime.fromisoformat(occurred_at_raw)
     except ValueError:
         return ApiResponse.bad_request('occurred_at 格式不正确')
 
@@ -173,21 +180,14 @@ def complete_round_webhook() -> Tuple[dict, int]:
     if not session:
         return ApiResponse.not_found('面试会话')
 
-    if str(session.room.id) != room_id:
+    if str(session.room_id) != room_id:
         return ApiResponse.bad_request('room_id 与 session_id 不匹配')
 
     round_obj = RoundService.get_round_by_session_and_index(session_id, round_index)
     if not round_obj:
         return ApiResponse.not_found('面试轮次')
 
-    existing_completion = RoundCompletionService.get_by_idempotency(idempotency_key)
-    if existing_completion:
-        return ApiResponse.success(
-            data={'completion_id': existing_completion.id},
-            message='轮次完成事件已处理'
-        )
-
-    existing_completion = RoundCompletionService.get_by_session_and_index(session, round_index)
+    existing_completion = RoundCompletionService.get_existing(idempotency_key, session, round_index)
     if existing_completion:
         return ApiResponse.success(
             data={'completion_id': existing_completion.id},
@@ -218,7 +218,7 @@ def complete_round_webhook() -> Tuple[dict, int]:
 def test_minio() -> Tuple[dict, int]:
     """测试MinIO连接"""
     try:
-        objects = minio_client.list_objects(prefix="data/")
+        objects = get_minio_client().list_objects(prefix="data/")
         resume_data = download_resume_data()
         return ApiResponse.success(data={
             'minio_objects': objects,
@@ -20,10 +20,10 @@ from dotenv import load_dotenv
 from datetime import datetime, timedelta
 import logging
 import os
+import secrets
 import time
-import random
-import string
 from flask import request
+from backend.common.cache import TTLCache
 from backend.common.response import ApiResponse
 from backend.common.middleware import handle_exceptions
 # 加载环境变量
@@ -38,16 +38,15 @@ JWT_SECRET = os.getenv("JWT_SECRET", "e802e988a02546cc47415e4bc76346aae7ceece97a
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRE_HOURS = 1
 
-# 模拟 Redis：存储 challenge（生产环境请替换为 Redis）
-challenges: Dict[str, Dict[str, Any]] = {}
+# 成功状态对象（只读，所有成功响应共用）
+_OK_STATUS = CommonResponseStatus(CommonResponseCodeEnum.OK)
 
-# 工具函数
-def generate_random_string(length: int = 8) -> str:
-    return ''.join(random.choices(string.ascii_lowercase + string.digits, k=length))
+# challenge有效期（秒）
+CHALLENGE_TTL = 5 * 60
 
-def is_challenge_expired(timestamp_ms: int, ttl_minutes: int = 5) -> bool:
-    now_ms = int(time.time() * 1000)
-    return (now_ms - timestamp_ms) > (ttl_minutes * 60 * 1000)
+# 模拟 Redis：存储 challenge（生产环境请替换为 Redis）
+# 过期条目在读取时淘汰，条目数上限保证大量未完成的登录请求不会无限占用内存
+challenges = TTLCache(ttl=CHALLENGE_TTL, maxsize=10000)
 
 @handle_exceptions
 def auth_challenge(body):  # noqa: E501
@@ -58,18 +57,15 @@ def auth_challenge(body):  # noqa: E501
         return ApiResponse.bad_request("address 字段不能为空")
 
     # 生成 challenge
-    random_part = generate_random_string()
+    random_part = secrets.token_hex(4)
     challenge = f"请签名以登录 YeYing Wallet\n\n随机数: {random_part}\n时间戳: {int(time.time() * 1000)}"
 
     addr_key = address.lower()
-    challenges[addr_key] = {
-        "challenge": challenge,
-        "timestamp": int(time.time() * 1000)
-    }
+    challenges.set(addr_key, challenge)
 
     logger.info(f"Generated challenge for {addr_key}: {challenge}")
     return AuthChallengeResponse(body=AuthChallengeResponseBody(
-        status=CommonResponseStatus(CommonResponseCodeEnum.OK),
+        status=_OK_STATUS,
         result=challenge
     ))
 
@@ -85,16 +81,15 @@ def auth_verify(body):  # noqa: E501
         )
 
     addr_key = address.lower()
-    challenge_data = challenges.get(addr_key)
+    challenge = challenges.get(addr_key)
 
-    if not challenge_data or is_challenge_expired(challenge_data["timestamp"]):
-        challenges.pop(addr_key, None)
+    if not challenge:
         raise Exception(
             "Challenge 不存在或已过期"
         )
 
     try:
-        message = encode_defunct(text=challenge_data["challenge"])
+        message = encode_defunct(text=challenge)
         logger.info(f"authVerify message={message}")
         logger.info(f"authVerify signature={signature}")
         recovered_address = Account.recover_message(message, signature=signature)
@@ -104,7 +99,7 @@ def auth_verify(body):  # noqa: E501
                 "签名验证失败"
             )
 
-        challenges.pop(addr_key, None)
+        challenges.delete(addr_key)
 
         expire = datetime.utcnow() + timedelta(hours=JWT_EXPIRE_HOURS)
         token = jwt.encode(
@@ -115,7 +110,7 @@ def auth_verify(body):  # noqa: E501
 
         logger.info(f"Login successful for {addr_key}")
         return AuthVerifyResponse(body=AuthVerifyResponseBody(
-            status=CommonResponseStatus(CommonResponseCodeEnum.OK),
+            status=_OK_STATUS,
             token=token
         ))
 
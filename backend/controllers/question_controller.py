@@ -3,26 +3,59 @@
 负责面试问题生成、获取、回答相关的路由处理
 """
 
-import os
+import logging
+import orjson
 from datetime import datetime
+from typing import Annotated, Any
 from flask import Blueprint, request, jsonify
-from backend.services.interview_service import SessionService
+from pydantic import BaseModel, BeforeValidator, Field
+from peewee import fn
+from backend.services.interview_service import RoomService, SessionService, invalidate_stats_cache
+from backend.services.question import get_question_generation_service
+from backend.clients.rag.rag_client import get_rag_client
 from backend.clients.digitalhub_client import start_llm
-from backend.clients.minio_client import minio_client
+from backend.clients.minio_client import get_minio_client
+from backend.common.clock import now_iso
+from backend.common.config import config
 from backend.common.response import ApiResponse
+from backend.common.validators import validate_json
 from backend.common.logger import get_logger
-from backend.models.models import Round, database
+from backend.models.models import Round, Session, database
 
 logger = get_logger(__name__)
 
 # 创建蓝图
 question_bp = Blueprint('question', __name__)
 
+# 启动LLM Round Server的固定参数（来自配置，导入时解析一次）
+_LLM_SERVER_ARGS = {
+    'port': config.LLM_PORT,
+    'minio_endpoint': config.MINIO_ENDPOINT,
+    'minio_access_key': config.MINIO_ACCESS_KEY or '',
+    'minio_secret_key': config.MINIO_SECRET_KEY or '',
+    'minio_bucket': config.MINIO_BUCKET,
+    'minio_secure': config.MINIO_SECURE,
+}
+
+
+def _int_to_str(value: Any) -> Any:
+    """数字形式的ID转为字符串（布尔值除外）"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+class SaveAnswerSchema(BaseModel):
+    """保存回答请求体"""
+    # 兼容数字形式的qa_id，统一转为字符串
+    qa_id: Annotated[str, BeforeValidator(_int_to_str)] = Field(min_length=1)
+    answer_text: str = Field(min_length=1)
+
 
 @question_bp.route('/generate_questions/<session_id>', methods=['POST'])
 def generate_questions(session_id):
     """生成面试题 + 启动 LLM Round Server"""
-    logger.debug(f"Generating questions for session: {session_id}")
+    logger.debug("Generating questions for session: %s", session_id)
 
     session = SessionService.get_session(session_id)
     if not session:
@@ -30,7 +63,6 @@ def generate_questions(session_id):
 
     try:
         # 生成问题
-        from backend.services.question import get_question_generation_service
         service = get_question_generation_service()
         result = service.generate_questions(session_id)
 
@@ -39,7 +71,7 @@ def generate_questions(session_id):
 
         # 启动LLM
         #_start_llm_server(session_id, result, result.get('round_index', 0))
-        _start_llm_server(session_id, session.room.id, result, result.get('round_index', 0))
+        _start_llm_server(session_id, session.room_id, result, result.get('round_index', 0))
         return ApiResponse.success(data=result)
 
     except Exception as e:
@@ -50,11 +82,10 @@ def generate_questions(session_id):
 @question_bp.route('/upload_jd/<room_id>', methods=['POST'])
 def upload_jd(room_id: str):
     """为面试间上传自定义 JD"""
-    logger.debug(f"Uploading JD for room: {room_id}")
+    logger.debug("Uploading JD for room: %s", room_id)
 
     try:
         # 验证 room 是否存在
-        from backend.services.interview_service import RoomService
         room = RoomService.get_room(room_id)
         if not room:
             return ApiResponse.not_found("面试间")
@@ -67,7 +98,6 @@ def upload_jd(room_id: str):
         if not content:
             return ApiResponse.bad_request('JD 内容不能为空')
 
-        from backend.clients.rag.rag_client import get_rag_client
         rag_client = get_rag_client()
 
         # 调用 RAG 上传 JD
@@ -81,6 +111,7 @@ def upload_jd(room_id: str):
         # 保存 jd_id 到 room
         room.jd_id = jd_id
         room.save()
+        invalidate_stats_cache()  # 面试间列表中的updated_at已变化
 
         logger.info(f"Successfully uploaded JD for room {room_id}: {jd_id}")
         return ApiResponse.success(data={'jd_id': jd_id}, message='JD上传成功')
@@ -93,10 +124,9 @@ def upload_jd(room_id: str):
 @question_bp.route('/get_current_question/<round_id>')
 def get_current_question(round_id):
     """获取当前问题"""
-    logger.debug(f"Getting current question for round: {round_id}")
+    logger.debug("Getting current question for round: %s", round_id)
 
     try:
-        from backend.services.question import get_question_generation_service
         service = get_question_generation_service()
         question_data = service.get_current_question(round_id)
 
@@ -111,19 +141,15 @@ def get_current_question(round_id):
 
 
 @question_bp.route('/save_answer', methods=['POST'])
-def save_answer():
+@validate_json(SaveAnswerSchema)
+def save_answer(validated_data):
     """保存用户回答"""
     logger.debug("Saving answer")
 
     try:
-        data = request.get_json()
-        qa_id = data.get('qa_id')
-        answer_text = data.get('answer_text')
+        qa_id = validated_data['qa_id']
+        answer_text = validated_data['answer_text']
 
-        if not qa_id or not answer_text:
-            return ApiResponse.bad_request('缺少必要参数')
-
-        from backend.services.question import get_question_generation_service
         service = get_question_generation_service()
         result = service.save_answer(qa_id, answer_text.strip())
 
@@ -137,17 +163,16 @@ def save_answer():
 @question_bp.route('/get_qa_analysis/<session_id>/<int:round_index>')
 def get_qa_analysis(session_id, round_index):
     """获取指定轮次的QA分析数据"""
-    logger.debug(f"Getting QA analysis for session: {session_id}, round: {round_index}")
+    logger.debug("Getting QA analysis for session: %s, round: %s", session_id, round_index)
 
     try:
-        from backend.clients.minio_client import minio_client
-
         analysis_filename = f"analysis/qa_complete_{round_index}_{session_id}.json"
-        analysis_data = minio_client.download_json(analysis_filename)
+        analysis_bytes = get_minio_client().download_bytes(analysis_filename)
 
-        if analysis_data:
+        if analysis_bytes:
+            # 分析文件本身就是JSON，原样嵌入响应，免去解析再序列化
             return ApiResponse.success(data={
-                'analysis_data': analysis_data,
+                'analysis_data': orjson.Fragment(analysis_bytes),
                 'file_path': analysis_filename
             })
         else:
@@ -170,7 +195,6 @@ def confirm_qa_completion(session_id, round_index):
         request.headers.get('Idempotency-Key')
         or payload.get('idempotency_key')
     )
-    event_time = datetime.now().isoformat()
 
     session_obj = SessionService.get_session(session_id)
     if not session_obj:
@@ -192,12 +216,12 @@ def confirm_qa_completion(session_id, round_index):
         )
         return ApiResponse.not_found("轮次")
 
-    room_id = session_obj.room.id
+    room_id = session_obj.room_id
     qa_object_path = (
         f"rooms/{room_id}/sessions/{session_id}/analysis/qa_complete_{round_index}.json"
     )
 
-    if not minio_client.object_exists(qa_object_path):
+    if not get_minio_client().object_exists(qa_object_path):
         logger.warning(
             "QA object missing for session %s round %s at %s (idempotency_key=%s)",
             session_id,
@@ -209,18 +233,22 @@ def confirm_qa_completion(session_id, round_index):
 
     try:
         with database.atomic():
-            round_obj = Round.get_by_id(round_obj.id)
-            if round_obj.status != 'completed':
-                round_obj.status = 'completed'
-                round_obj.save()
-
-                has_active_rounds = Round.select().where(
+            # 条件UPDATE本身保证只有首次确认生效，无需重新读取轮次
+            updated_at = datetime.now()
+            updated = Round.update(status='completed', updated_at=updated_at).where(
+                (Round.id == round_obj.id) & (Round.status != 'completed')
+            ).execute()
+
+            if updated:
+                # 会话下已没有未完成的轮次时标记会话完成，判断和更新在同一条SQL中完成
+                active_rounds = Round.select(Round.id).where(
                     (Round.session == session_obj) & (Round.status != 'completed')
-                ).exists()
-
-                if not has_active_rounds and session_obj.status != 'completed':
-                    session_obj.status = 'completed'
-                    session_obj.save()
+                )
+                Session.update(status='completed', updated_at=updated_at).where(
+                    (Session.id == session_obj.id)
+                    & (Session.status != 'completed')
+                    & ~fn.EXISTS(active_rounds)
+                ).execute()
     except Exception as exc:
         logger.error(
             "Failed to update completion status for session %s round %s: %s",
@@ -231,14 +259,16 @@ def confirm_qa_completion(session_id, round_index):
         )
         return ApiResponse.internal_error("更新轮次状态失败")
 
-    logger.info(
-        "QA completion confirmed for session %s round %s: path=%s, idempotency_key=%s, timestamp=%s",
-        session_id,
-        round_index,
-        qa_object_path,
-        idempotency_key,
-        event_time,
-    )
+    # 时间戳只用于日志，INFO级别关闭时不生成
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "QA completion confirmed for session %s round %s: path=%s, idempotency_key=%s, timestamp=%s",
+            session_id,
+            round_index,
+            qa_object_path,
+            idempotency_key,
+            now_iso(),
+        )
 
     return jsonify({
         "is_completed": True,
@@ -255,16 +285,11 @@ def _start_llm_server(session_id: str, room_id: str, result: dict, round_index:
             room_id=room_id,
             session_id=session_id,
             round_index=int(round_index),
-            port=int(os.getenv("LLM_PORT", "8011")),
-            minio_endpoint=os.getenv("MINIO_ENDPOINT", "test-minio.yeying.pub"),
-            minio_access_key=os.getenv("MINIO_ACCESS_KEY", ""),
-            minio_secret_key=os.getenv("MINIO_SECRET_KEY", ""),
-            minio_bucket=os.getenv("MINIO_BUCKET", "yeying-interviewer"),
-            minio_secure=os.getenv("MINIO_SECURE", "true").lower() == "true",
+            **_LLM_SERVER_ARGS,
         )
         result['llm'] = llm_info.get('data', llm_info)
     except Exception as e:
-        logger.warning(f"Failed to start LLM server: {e}")
+        logger.warning("Failed to start LLM server: %s", e)
         result['llm_error'] = str(e)
 
 
@@ -3,10 +3,12 @@
 负责面试报告生成、获取、下载相关的路由处理
 """
 
+import orjson
 from flask import Blueprint, Response
 from backend.services.interview_service import RoundService
-from backend.common.response import ApiResponse
-from backend.clients.minio_client import minio_client
+from backend.services.report_service import get_report_service
+from backend.common.response import ApiResponse, ResponseCode
+from backend.clients.minio_client import get_minio_client
 from backend.common.logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,59 +19,45 @@ report_bp = Blueprint('report', __name__, url_prefix='/api')
 
 @report_bp.route('/generate_report/<session_id>/<int:round_index>', methods=['POST'])
 def generate_report(session_id, round_index):
-    """生成面试评价报告"""
-    logger.debug(f"Generating report for session: {session_id}, round: {round_index}")
+    """提交面试评价报告生成任务（后台执行，通过 /api/tasks/<task_id> 查询进度）"""
+    logger.debug("Generating report for session: %s, round: %s", session_id, round_index)
 
     try:
-        from backend.services.evaluation_service import get_evaluation_service
-        from backend.services.pdf import get_pdf_generator
-
-        # 生成评价数据
-        evaluation_service = get_evaluation_service()
-        eval_result = evaluation_service.generate_evaluation_report(session_id, round_index)
-
-        if not eval_result.get('success'):
-            return ApiResponse.error(eval_result.get('error', '生成评价失败'))
-
-        # 生成PDF报告
-        pdf_generator = get_pdf_generator()
-        pdf_bytes = pdf_generator.generate_report_pdf(eval_result['report_data'])
-
-        if not pdf_bytes:
-            return ApiResponse.error('PDF生成失败')
-
-        # 保存PDF到MinIO
-        pdf_filename = pdf_generator.save_pdf_to_minio(pdf_bytes, session_id, round_index)
-
-        if not pdf_filename:
-            return ApiResponse.error('PDF保存失败')
-
-        return ApiResponse.success(data={
-            'evaluation_filename': eval_result['report_filename'],
-            'pdf_filename': pdf_filename,
-            'report_data': eval_result['report_data']
-        })
+        task = get_report_service().submit(session_id, round_index)
+        return ApiResponse.success(data=task, message='报告生成任务已提交', code=ResponseCode.ACCEPTED)
 
     except Exception as e:
-        logger.error(f"Failed to generate report: {e}", exc_info=True)
+        logger.error(f"Failed to submit report task: {e}", exc_info=True)
         return ApiResponse.internal_error(f'生成报告失败: {str(e)}')
 
 
+@report_bp.route('/tasks/<task_id>')
+def get_report_task(task_id):
+    """查询报告生成任务状态"""
+    task = get_report_service().get_task(task_id)
+    if not task:
+        return ApiResponse.not_found("任务")
+    return ApiResponse.success(data=task)
+
+
 @report_bp.route('/reports/<session_id>/<int:round_index>')
 def get_report(session_id, round_index):
     """获取指定会话轮次的报告"""
-    logger.debug(f"Getting report for session: {session_id}, round: {round_index}")
+    logger.debug("Getting report for session: %s, round: %s", session_id, round_index)
 
     try:
         evaluation_filename = f"reports/evaluation_{round_index}_{session_id}.json"
-        evaluation_data = minio_client.download_json(evaluation_filename)
+        # 报告尚未生成属于正常情况（生成任务轮询也会查询），不记录错误日志
+        evaluation_bytes = get_minio_client().download_bytes(evaluation_filename, missing_ok=True)
 
-        pdf_filename = f"reports/interview_report_{round_index}_{session_id}.pdf"
-        pdf_exists = pdf_filename in minio_client.list_objects(prefix="reports/")
+        if evaluation_bytes:
+            # 单个对象是否存在用HEAD(stat_object)判断，无需列举整个报告目录
+            pdf_filename = f"reports/interview_report_{round_index}_{session_id}.pdf"
+            pdf_exists = get_minio_client().object_exists(pdf_filename)
 
-        if evaluation_data:
+            # 评价报告生成后不再修改，原样嵌入响应，免去解析再序列化
             return ApiResponse.success(data={
-                'evaluation_data': evaluation_data,
+                'evaluation_data': orjson.Fragment(evaluation_bytes),
                 'evaluation_filename': evaluation_filename,
                 'pdf_filename': pdf_filename if pdf_exists else None,
                 'pdf_exists': pdf_exists
@@ -85,22 +73,22 @@ def get_report(session_id, round_index):
 @report_bp.route('/reports/download/<session_id>/<int:round_index>')
 def download_report_pdf(session_id, round_index):
     """下载PDF报告"""
-    logger.debug(f"Downloading report PDF for session: {session_id}, round: {round_index}")
+    logger.debug("Downloading report PDF for session: %s, round: %s", session_id, round_index)
 
     try:
         pdf_filename = f"reports/interview_report_{round_index}_{session_id}.pdf"
 
-        # 从MinIO下载PDF文件
-        pdf_object = minio_client.client.get_object(minio_client.bucket_name, pdf_filename)
-        pdf_data = pdf_object.data
+        # 从MinIO分块流式读取PDF文件，不在内存中保存整个文件
+        pdf_stream = get_minio_client().stream_object(pdf_filename)
 
-        return Response(
-            pdf_data,
-            mimetype='application/pdf',
-            headers={
-                'Content-Disposition': f'attachment; filename=interview_report_{session_id}_{round_index}.pdf'
-            }
-        )
+        headers = {
+            'Content-Disposition': f'attachment; filename=interview_report_{session_id}_{round_index}.pdf'
+        }
+        # 提供文件大小，浏览器可显示下载进度
+        if pdf_stream.content_length is not None:
+            headers['Content-Length'] = str(pdf_stream.content_length)
+
+        return Response(pdf_stream, mimetype='application/pdf', headers=headers)
 
     except Exception as e:
         logger.error(f"Failed to download report: {e}", exc_info=True)
@@ -110,26 +98,34 @@ def download_report_pdf(session_id, round_index):
 @report_bp.route('/reports/list/<session_id>')
 def list_session_reports(session_id):
     """列出指定会话的所有报告"""
-    logger.debug(f"Listing reports for session: {session_id}")
+    logger.debug("Listing reports for session: %s", session_id)
 
     try:
         rounds = RoundService.get_rounds_by_session(session_id)
         reports = []
 
-        for round_obj in rounds:
-            round_index = round_obj.round_index
-
-            # 检查评价报告
-            evaluation_filename = f"reports/evaluation_{round_index}_{session_id}.json"
-            evaluation_exists = evaluation_filename in minio_client.list_objects(prefix="reports/")
+        # 各轮次的报告对象名是确定的，直接并发HEAD检查，
+        # 不列举所有会话共用的报告目录（该目录随会话数增长，需要分页列举）
+        candidates = [
+            (
+                round_obj,
+                f"reports/evaluation_{round_obj.round_index}_{session_id}.json",
+                f"reports/interview_report_{round_obj.round_index}_{session_id}.pdf"
+            )
+            for round_obj in rounds
+        ]
+        existing_objects = get_minio_client().existing_objects(
+            [name for _, evaluation_filename, pdf_filename in candidates
+             for name in (evaluation_filename, pdf_filename)]
+        )
 
-            # 检查PDF报告
-            pdf_filename = f"reports/interview_report_{round_index}_{session_id}.pdf"
-            pdf_exists = pdf_filename in minio_client.list_objects(prefix="reports/")
+        for round_obj, evaluation_filename, pdf_filename in candidates:
+            evaluation_exists = evaluation_filename in existing_objects
+            pdf_exists = pdf_filename in existing_objects
 
             if evaluation_exists or pdf_exists:
                 reports.append({
-                    'round_index': round_index,
+                    'round_index': round_obj.round_index,
                     'round_id': round_obj.id,
                     'evaluation_exists': evaluation_exists,
                     'pdf_exists': pdf_exists,
@@ -3,12 +3,16 @@
 负责简历上传、解析、获取相关的路由处理
 """
 
-import tempfile
-import os
+import hashlib
 from flask import Blueprint, request
 from werkzeug.utils import secure_filename
 from backend.common.response import ApiResponse
-from backend.clients.minio_client import download_resume_data, upload_resume_data
+from backend.services.interview_service import RoomService
+from backend.services.resume_parser import get_resume_parser
+from backend.clients.minio_client import (
+    download_resume_data, upload_resume_data, download_parsed_resume, upload_parsed_resume
+)
+from backend.clients.mineru_client import get_mineru_client
 from backend.common.logger import get_logger
 
 logger = get_logger(__name__)
@@ -20,11 +24,10 @@ resume_bp = Blueprint('resume', __name__)
 @resume_bp.route('/upload_resume/<room_id>', methods=['POST'])
 def upload_resume(room_id: str):
     """上传简历PDF并解析为结构化数据，绑定到指定的room"""
-    logger.debug(f"Uploading resume for room: {room_id}")
+    logger.debug("Uploading resume for room: %s", room_id)
 
     try:
         # 验证room是否存在
-        from backend.services.interview_service import RoomService
         room = RoomService.get_room(room_id)
         if not room:
             return ApiResponse.not_found("面试间")
@@ -44,12 +47,16 @@ def upload_resume(room_id: str):
         # 获取公司信息（可选）
         company = request.form.get('company', '').strip() or None
 
-        # 保存临时文件
-        temp_path = _save_temp_file(file)
+        # 同一份PDF已解析过时直接复用结果，跳过MinerU解析和大模型提取
+        pdf_digest = _hash_stream(file.stream)
+        resume_data = download_parsed_resume(pdf_digest)
 
-        try:
-            # 解析PDF
-            markdown_content = _parse_pdf(temp_path)
+        if resume_data:
+            logger.info(f"Reusing parsed resume for PDF {pdf_digest}")
+        else:
+            # 解析PDF：直接使用上传文件流（UPLOAD_SPOOL_MAX_SIZE以内保存在内存、超出才落盘），
+            # 不再额外复制一份临时文件
+            markdown_content = _parse_pdf(file.stream)
 
             if not markdown_content:
                 return ApiResponse.internal_error('PDF解析失败，请稍后重试')
@@ -60,26 +67,25 @@ def upload_resume(room_id: str):
             if not resume_data:
                 return ApiResponse.internal_error('简历数据提取失败')
 
-            # 添加公司信息
-            if company:
-                resume_data['company'] = company
-                logger.info(f"Added company to resume: {company}")
+            # 缓存的是PDF本身的解析结果，不含本次上传填写的公司信息
+            if not upload_parsed_resume(resume_data, pdf_digest):
+                logger.warning("Failed to cache parsed resume for PDF %s", pdf_digest)
 
-            # 保存到MinIO（绑定到指定room）
-            success = upload_resume_data(resume_data, room_id)
+        # 添加公司信息
+        if company:
+            resume_data['company'] = company
+            logger.info(f"Added company to resume: {company}")
 
-            if not success:
-                return ApiResponse.internal_error('简历保存失败')
+        # 保存到MinIO（绑定到指定room）
+        success = upload_resume_data(resume_data, room_id)
 
-            return ApiResponse.success(
-                data={'resume_data': resume_data},
-                message='简历上传成功'
-            )
+        if not success:
+            return ApiResponse.internal_error('简历保存失败')
 
-        finally:
-            # 删除临时文件
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        return ApiResponse.success(
+            data={'resume_data': resume_data},
+            message='简历上传成功'
+        )
 
     except Exception as e:
         logger.error(f"Failed to upload resume: {e}", exc_info=True)
@@ -89,7 +95,7 @@ def upload_resume(room_id: str):
 @resume_bp.route('/api/resume/<room_id>')
 def get_resume_by_room(room_id: str):
     """获取指定room的简历数据"""
-    logger.debug(f"Getting resume for room: {room_id}")
+    logger.debug("Getting resume for room: %s", room_id)
 
     try:
         resume_data = download_resume_data(room_id)
@@ -106,23 +112,24 @@ def get_resume_by_room(room_id: str):
 
 # ==================== 私有辅助函数 ====================
 
-def _save_temp_file(file):
-    """保存上传文件到临时目录"""
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-        temp_path = temp_file.name
-        file.save(temp_path)
-    return temp_path
+def _hash_stream(stream) -> str:
+    """计算文件流的SHA-256，计算后将流复位到开头
+
+    file_digest用readinto读入同一块可复用的缓冲区，不会逐块分配新的bytes对象
+    """
+    stream.seek(0)
+    digest = hashlib.file_digest(stream, 'sha256')
+    stream.seek(0)
+    return digest.hexdigest()
 
 
-def _parse_pdf(file_path):
+def _parse_pdf(pdf_file):
     """调用MinerU服务解析PDF"""
-    from backend.clients.mineru_client import get_mineru_client
     mineru_service = get_mineru_client()
-    return mineru_service.parse_pdf(file_path)
+    return mineru_service.parse_pdf(pdf_file)
 
 
 def _extract_resume_data(markdown_content):
     """使用LLM从Markdown提取结构化数据"""
-    from backend.services.resume_parser import get_resume_parser
     resume_parser = get_resume_parser()
     return resume_parser.extract_resume_data(markdown_content)
@@ -3,11 +3,13 @@
 负责面试间相关的路由处理
 """
 
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from flask import Blueprint, render_template, redirect, url_for, Response
 from typing import Union
-from backend.services.interview_service import RoomService, SessionService, RoundService
+from backend.services.interview_service import RoomService, SessionService
 from backend.clients.digitalhub_client import ping_dh
-from backend.common.validators import validate_uuid_param
 from backend.common.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,15 +17,19 @@ logger = get_logger(__name__)
 # 创建蓝图
 room_bp = Blueprint('room', __name__)
 
+# 后台ping数字人：结果只用于预热，不阻塞页面响应
+_ping_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='dh-ping')
+# 限制排队中的ping数量，数字人服务不可用时不会无限堆积任务
+_ping_slots = threading.BoundedSemaphore(8)
+
 
 @room_bp.route('/')
 def index():
     """首页 - 显示面试间列表和系统统计"""
-    rooms = RoomService.get_all_rooms()
-    rooms_dict = [RoomService.to_dict(room) for room in rooms]
+    rooms_dict = RoomService.get_room_list()
 
     # 计算系统统计数据
-    stats = _calculate_system_stats(rooms)
+    stats = RoomService.get_stats()
 
     return render_template('index.html', rooms=rooms_dict, stats=stats)
 
@@ -38,20 +44,18 @@ def create_room():
     return redirect(url_for('room.room_detail', room_id=room.id))
 
 
-@room_bp.route('/room/<room_id>')
-@validate_uuid_param('room_id')
-def room_detail(room_id: str) -> Union[str, tuple[str, int]]:
+@room_bp.route('/room/<uuid:room_id>')
+def room_detail(room_id: uuid.UUID) -> Union[str, tuple[str, int]]:
     """面试间详情页面"""
     # 静默ping数字人
     _ping_digital_human()
 
-    room = RoomService.get_room(room_id)
+    room = RoomService.get_room(str(room_id))
     if not room:
-        logger.warning(f"Room not found: {room_id}")
+        logger.warning("Room not found: %s", room_id)
         return "面试间不存在", 404
 
-    sessions = SessionService.get_sessions_by_room(room_id)
-    sessions_dict = [SessionService.to_dict(session) for session in sessions]
+    sessions_dict = SessionService.get_session_list(room.id)
 
     return render_template('room.html',
                          room=RoomService.to_dict(room),
@@ -60,34 +64,23 @@ def room_detail(room_id: str) -> Union[str, tuple[str, int]]:
 
 # ==================== 私有辅助函数 ====================
 
-def _calculate_system_stats(rooms) -> dict:
-    """计算系统统计数据"""
-    total_sessions = 0
-    total_rounds = 0
-    total_questions = 0
-
-    for room in rooms:
-        sessions = SessionService.get_sessions_by_room(room.id)
-        total_sessions += len(sessions)
-
-        for session in sessions:
-            rounds = RoundService.get_rounds_by_session(session.id)
-            total_rounds += len(rounds)
-
-            for round_obj in rounds:
-                total_questions += round_obj.questions_count
+def _ping_digital_human() -> None:
+    """静默ping数字人服务（后台执行，立即返回）"""
+    if not _ping_slots.acquire(blocking=False):
+        logger.debug("Skip digital human ping: too many pending pings")
+        return
 
-    return {
-        'total_rooms': len(rooms),
-        'total_sessions': total_sessions,
-        'total_rounds': total_rounds,
-        'total_questions': total_questions
-    }
+    try:
+        _ping_executor.submit(_run_ping)
+    except Exception as e:
+        _ping_slots.release()
+        logger.warning("Failed to schedule digital human ping: %s", e)
 
 
-def _ping_digital_human() -> None:
-    """静默ping数字人服务"""
+def _run_ping() -> None:
     try:
         ping_dh()
     except Exception as e:
-        logger.warning(f"Failed to ping digital human: {e}")
+        logger.warning("Failed to ping digital human: %s", e)
+    finally:
+        _ping_slots.release()
@@ -4,11 +4,12 @@
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, urlunparse
 from flask import Blueprint, render_template, redirect, url_for
 from backend.services.interview_service import SessionService, RoundService
 from backend.clients.digitalhub_client import boot_dh
-from backend.clients.minio_client import download_resume_data, minio_client
+from backend.clients.minio_client import download_resume_data, download_session_questions
 from backend.common.logger import get_logger
 
 logger = get_logger(__name__)
@@ -19,6 +20,9 @@ session_bp = Blueprint('session', __name__)
 DEFAULT_PUBLIC_HOST = "vtuber.yeying.pub"
 PLACEHOLDER_HOSTS = {"your_public_host_here", "your-public-host"}
 
+# 数字人启动线程池：boot_dh耗时较长，与页面其他数据加载并行进行
+_dh_boot_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='dh-boot')
+
 
 @session_bp.route('/create_session/<room_id>')
 def create_session(room_id):
@@ -26,7 +30,7 @@ def create_session(room_id):
     # 检查简历是否已上传
     resume_data = download_resume_data(room_id)
     if not resume_data:
-        logger.warning(f"Resume not found for room: {room_id}")
+        logger.warning("Resume not found for room: %s", room_id)
         return """
         <html>
         <head>
@@ -42,7 +46,7 @@ def create_session(room_id):
 
     session = SessionService.create_session(room_id)
     if not session:
-        logger.warning(f"Failed to create session for room: {room_id}")
+        logger.warning("Failed to create session for room: %s", room_id)
         return "面试间不存在", 404
 
     return redirect(url_for('session.session_detail', session_id=session.id))
@@ -53,24 +57,28 @@ def session_detail(session_id):
     """面试会话详情页面"""
     session = SessionService.get_session(session_id)
     if not session:
-        logger.warning(f"Session not found: {session_id}")
+        logger.warning("Session not found: %s", session_id)
         return "面试会话不存在", 404
 
-    # 启动数字人
-    dh_message, dh_connect_url = _boot_digital_human(session)
+    # 启动数字人（后台线程执行，只用到会话ID，不访问数据库）
+    dh_future = _dh_boot_executor.submit(_boot_digital_human, session)
 
     # 获取轮次数据
     rounds_dict = _load_session_rounds(session)
 
     # 获取简历数据（从session关联的room获取）
-    room_id = session.room.id
+    room_id = session.room_id
     resume_data = download_resume_data(room_id)
 
     # 检查是否有自定义 JD
     has_custom_jd = bool(session.room.jd_id)
+    session_dict = SessionService.to_dict(session)
+
+    # 页面需要数字人连接信息，等待启动结果（_boot_digital_human内部已处理异常）
+    dh_message, dh_connect_url = dh_future.result()
 
     return render_template('session.html',
-                         session=SessionService.to_dict(session),
+                         session=session_dict,
                          rounds=rounds_dict,
                          resume=resume_data,
                          has_custom_jd=has_custom_jd,
@@ -133,41 +141,19 @@ def _boot_digital_human(session):
                                           dh_connect_url, public_host)
         return dh_message, dh_connect_url
     except Exception as e:
-        logger.warning(f"Failed to boot digital human for session {session.id}: {e}")
+        logger.warning("Failed to boot digital human for session %s: %s", session.id, e)
         return None, None
 
 
 def _load_session_rounds(session):
-    """加载会话的所有轮次数据"""
-    session_id = session.id
-    room_id = session.room.id
-
-    rounds = RoundService.get_rounds_by_session(session_id)
-    rounds_dict = []
-
-    for round_obj in rounds:
-        round_data = RoundService.to_dict(round_obj)
-
-        # 加载问题数据
-        try:
-            questions = _load_round_questions(room_id, session_id, round_data['round_index'])
-            round_data['questions'] = questions
-        except Exception as e:
-            logger.error(f"Error loading questions for round {round_data['id']}: {e}")
-            round_data['questions'] = []
+    """加载会话的所有轮次数据（各轮问题优先从会话问题索引一次性获取）"""
+    rounds = RoundService.get_rounds_by_session(session.id)
+    rounds_dict = [RoundService.to_dict(round_obj) for round_obj in rounds]
+    if not rounds_dict:
+        return rounds_dict
 
-        rounds_dict.append(round_data)
+    questions_list = download_session_questions(session.room_id, session.id, rounds)
+    for round_data, questions_data in zip(rounds_dict, questions_list):
+        round_data['questions'] = questions_data.get('questions', []) if questions_data else []
 
     return rounds_dict
-
-
-def _load_round_questions(room_id: str, session_id: str, round_index: int):
-    """从MinIO加载轮次问题数据"""
-    questions_data = minio_client.download_json(
-        f"rooms/{room_id}/sessions/{session_id}/questions/round_{round_index}.json"
-    )
-
-    if questions_data:
-        return questions_data.get('questions', [])
-
-    return []
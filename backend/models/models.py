@@ -21,7 +21,14 @@ if DATABASE_PATH != ':memory:' and os.path.dirname(DATABASE_PATH):
     os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
 
 # 数据库连接
-database = SqliteDatabase(DATABASE_PATH)
+# WAL模式下读请求不会被写事务阻塞；synchronous=normal 在WAL下仍可保证崩溃后数据库一致
+database = SqliteDatabase(DATABASE_PATH, pragmas={
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    'cache_size': -64 * 1024,  # 页缓存64MB（负数表示KB）
+    'mmap_size': 256 * 1024 * 1024,
+    'temp_store': 'memory',
+})
 
 
 class BaseModel(Model):
@@ -57,6 +64,10 @@ class Session(BaseModel):
     
     class Meta:
         table_name = 'sessions'
+        # 按面试间列出会话并按创建时间排序，索引直接提供顺序
+        indexes = (
+            (('room', 'created_at'), False),
+        )
 
 
 class Round(BaseModel):
@@ -72,6 +83,10 @@ class Round(BaseModel):
 
     class Meta:
         table_name = 'rounds'
+        # 按会话列出轮次（按round_index排序）以及按会话+轮次索引定位轮次
+        indexes = (
+            (('session', 'round_index'), False),
+        )
 
 
 class QuestionAnswer(BaseModel):
@@ -86,6 +101,10 @@ class QuestionAnswer(BaseModel):
 
     class Meta:
         table_name = 'question_answers'
+        # 按轮次读取问答记录（按question_index排序或定位当前问题）
+        indexes = (
+            (('round', 'question_index'), False),
+        )
 
 
 class RoundCompletion(BaseModel):
@@ -105,12 +124,45 @@ class RoundCompletion(BaseModel):
         )
 
 
+class ReportTask(BaseModel):
+    """报告生成任务模型（任务状态保存在数据库中，多个工作进程共享）"""
+
+    id = CharField(primary_key=True)
+    session_id = CharField()
+    round_index = IntegerField()
+    status = CharField(default='pending')  # pending, running, success, failed
+    result = TextField(null=True)  # 生成结果（JSON）
+    error = TextField(null=True)
+
+    class Meta:
+        table_name = 'report_tasks'
+        # 提交任务时按会话+轮次查找进行中的任务
+        indexes = (
+            (('session_id', 'round_index'), False),
+        )
+
+
+def migrate_round_questions_keys() -> None:
+    """将旧版轮次题目路径（data/questions_round_*）回填为实际的MinIO对象名称"""
+    database.execute_sql(
+        """
+        UPDATE rounds
+        SET questions_file_path = 'rooms/'
+            || (SELECT room_id FROM sessions WHERE sessions.id = rounds.session_id)
+            || '/sessions/' || session_id
+            || '/questions/round_' || round_index || '.json'
+        WHERE questions_file_path LIKE 'data/questions_round_%'
+        """
+    )
+
+
 def create_tables() -> None:
-    """创建数据库表"""
+    """创建数据库表（已有表时只补建缺失的索引）"""
     if not database.is_closed():
         database.close()
     database.connect()
-    database.create_tables([Room, Session, Round, QuestionAnswer, RoundCompletion], safe=True)
+    database.create_tables([Room, Session, Round, QuestionAnswer, RoundCompletion, ReportTask], safe=True)
+    migrate_round_questions_keys()
     database.close()
 
 
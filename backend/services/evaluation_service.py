@@ -3,30 +3,45 @@
 基于华为面试报告模板，使用大模型对面试QA进行综合评价
 """
 
-import json
+import orjson
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-from backend.clients.minio_client import minio_client
-from backend.clients.llm.qwen_client import QwenClient
+from backend.services.interview_service import SessionService
+from backend.clients.minio_client import get_minio_client, download_qa_analysis
+from backend.clients.llm.qwen_client import get_qwen_client
 from backend.clients.llm.prompts.evaluation_prompts import (
     get_interview_evaluation_prompt,
     get_single_question_evaluation_prompt,
     get_report_summary_prompt
 )
+from backend.common.clock import now_iso
 from backend.common.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 评价报告上传线程池：上传与PDF生成并行进行
+_save_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='report-save')
+
 
 class InterviewEvaluationService:
     """面试评价服务"""
 
     def __init__(self):
-        self.qwen_client = QwenClient()
-
-    def generate_evaluation_report(self, session_id: str, round_index: int) -> Optional[Dict[str, Any]]:
-        """生成面试评价报告"""
+        self.qwen_client = get_qwen_client()
+
+    def generate_evaluation_report(self, session_id: str, round_index: int,
+                                   defer_save: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        生成面试评价报告
+
+        Args:
+            session_id: 会话ID
+            round_index: 轮次索引
+            defer_save: 为True时评价报告在后台线程上传MinIO，结果中附带save_future，
+                调用方可在此期间继续生成PDF，随后通过save_future.result()确认保存完成
+        """
         try:
             # 1. 加载QA数据
             qa_data = self._load_qa_data(session_id, round_index)
@@ -41,17 +56,20 @@ class InterviewEvaluationService:
 
             # 4. 保存评价报告到MinIO
             report_filename = f"reports/evaluation_{round_index}_{session_id}.json"
-            success = minio_client.upload_json(report_filename, report_data)
-
-            if success:
-                logger.info(f"Evaluation report saved: {report_filename}")
-                return {
-                    'success': True,
-                    'report_data': report_data,
-                    'report_filename': report_filename
-                }
+            result = {
+                'success': True,
+                'report_data': report_data,
+                'report_filename': report_filename
+            }
+
+            if defer_save:
+                result['save_future'] = _save_executor.submit(
+                    self._save_evaluation_report, report_filename, report_data
+                )
             else:
-                raise Exception("保存评价报告失败")
+                self._save_evaluation_report(report_filename, report_data)
+
+            return result
 
         except Exception as e:
             logger.error(f"Error generating evaluation report: {e}", exc_info=True)
@@ -60,18 +78,22 @@ class InterviewEvaluationService:
                 'error': str(e)
             }
 
+    def _save_evaluation_report(self, report_filename: str, report_data: Dict[str, Any]) -> None:
+        """保存评价报告到MinIO，失败时抛出异常"""
+        if not get_minio_client().upload_json(report_filename, report_data):
+            raise Exception("保存评价报告失败")
+        logger.info(f"Evaluation report saved: {report_filename}")
+
     def _load_qa_data(self, session_id: str, round_index: int) -> Optional[Dict[str, Any]]:
         """加载QA完成数据"""
         # 获取session对应的room_id
-        from backend.services.interview_service import SessionService
         session = SessionService.get_session(session_id)
         if not session:
             return None
 
-        room_id = session.room.id
+        room_id = session.room_id
 
         # 使用新的路径结构
-        from backend.clients.minio_client import download_qa_analysis
         return download_qa_analysis(room_id, session_id, round_index)
 
     def _evaluate_with_llm(self, qa_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -102,10 +124,10 @@ class InterviewEvaluationService:
                 response = response[:-3]
 
             # 解析JSON
-            evaluation_data = json.loads(response)
+            evaluation_data = orjson.loads(response)
             return evaluation_data
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM response as JSON: {e}", exc_info=True)
             return self._get_default_evaluation()
 
@@ -179,7 +201,7 @@ class InterviewEvaluationService:
 
         report_data = {
             "report_id": str(uuid.uuid4()),
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now_iso(),
             "session_info": {
                 "session_id": session_id,
                 "session_name": session_info.get('session_name', ''),
@@ -2,15 +2,35 @@
 面试管理服务
 """
 
-import json
+import itertools
+import orjson
 import uuid
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from backend.models.models import Room, Session, Round, RoundCompletion
+from peewee import fn
+from backend.models.models import Room, Session, Round, RoundCompletion, QuestionAnswer
+from backend.common.cache import TTLCache
+from backend.common.storage_keys import questions_object_key
 from backend.common.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 系统统计缓存：首页每次访问都会读取，房间/会话/轮次变更时失效
+_STATS_CACHE_KEY = 'system_stats'
+_stats_cache = TTLCache(ttl=30, maxsize=1)
+
+# 面试间列表缓存：首页和 /api/rooms 共用，以数据版本号为键，变更后旧条目不再命中
+_room_list_cache = TTLCache(ttl=30, maxsize=4)
+_data_version = itertools.count(1)
+_current_version = next(_data_version)
+
+
+def invalidate_stats_cache() -> None:
+    """使系统统计及面试间列表缓存失效（房间/会话/轮次增删时调用）"""
+    global _current_version
+    _current_version = next(_data_version)
+    _stats_cache.delete(_STATS_CACHE_KEY)
+
 
 class RoomService:
     """房间管理服务"""
@@ -38,6 +58,7 @@ class RoomService:
             memory_id=memory_id,
             name=room_name
         )
+        invalidate_stats_cache()
         return room
     
     @staticmethod
@@ -53,6 +74,64 @@ class RoomService:
         """获取所有面试间"""
         return list(Room.select().order_by(Room.created_at.desc()))
     
+    @staticmethod
+    def version() -> int:
+        """面试间相关数据的版本号，每次增删房间/会话/轮次后递增"""
+        return _current_version
+
+    @staticmethod
+    def get_room_list() -> List[Dict[str, Any]]:
+        """获取所有面试间的字典列表（按数据版本号短时缓存）"""
+        version = RoomService.version()
+        cached = _room_list_cache.get(version)
+        if cached is not None:
+            return cached
+
+        # 直接从游标读取字典行，不实例化Room模型
+        rows = (
+            Room.select(Room.id, Room.memory_id, Room.name, Room.created_at, Room.updated_at)
+            .order_by(Room.created_at.desc())
+            .dicts()
+        )
+        sessions_counts = SessionService.count_by_room()
+        rounds_counts = RoundService.count_by_room()
+        rooms_dict = [
+            {
+                **row,
+                'created_at': row['created_at'].isoformat(),
+                'updated_at': row['updated_at'].isoformat(),
+                'sessions_count': sessions_counts.get(row['id'], 0),
+                'rounds_count': rounds_counts.get(row['id'], 0)
+            }
+            for row in rows
+        ]
+        _room_list_cache.set(version, rooms_dict)
+        return rooms_dict
+
+    @staticmethod
+    def get_stats() -> Dict[str, int]:
+        """获取系统统计数据（聚合查询，不逐个遍历房间/会话；结果短时缓存）"""
+        cached = _stats_cache.get(_STATS_CACHE_KEY)
+        if cached is not None:
+            return cached
+
+        # 房间数和会话数作为标量子查询，四个统计值由一条SQL返回
+        total_rooms, total_sessions, total_rounds, total_questions = Round.select(
+            Room.select(fn.COUNT(Room.id)),
+            Session.select(fn.COUNT(Session.id)),
+            fn.COUNT(Round.id),
+            fn.COALESCE(fn.SUM(Round.questions_count), 0)
+        ).scalar(as_tuple=True)
+
+        stats = {
+            'total_rooms': total_rooms,
+            'total_sessions': total_sessions,
+            'total_rounds': total_rounds,
+            'total_questions': total_questions
+        }
+        _stats_cache.set(_STATS_CACHE_KEY, stats)
+        return stats
+
     @staticmethod
     def delete_room(room_id: str) -> bool:
         """删除面试间"""
@@ -62,6 +141,7 @@ class RoomService:
             for session in room.sessions:
                 SessionService.delete_session(session.id)
             room.delete_instance()
+            invalidate_stats_cache()
             return True
         except Room.DoesNotExist:
             return False
@@ -69,21 +149,26 @@ class RoomService:
     @staticmethod
     def to_dict(room: Room) -> Dict[str, Any]:
         """将Room对象转换为字典"""
-        sessions = SessionService.get_sessions_by_room(room.id)
-        total_rounds = 0
-        
-        for session in sessions:
-            rounds = RoundService.get_rounds_by_session(session.id)
-            total_rounds += len(rounds)
-        
+        # 只需要数量，使用COUNT查询而不是加载所有会话和轮次
+        sessions_count = Session.select().where(Session.room == room.id).count()
+        total_rounds = (
+            Round.select()
+            .join(Session)
+            .where(Session.room == room.id)
+            .count()
+        )
+        return RoomService._serialize(room, sessions_count, total_rounds)
+
+    @staticmethod
+    def _serialize(room: Room, sessions_count: int, rounds_count: int) -> Dict[str, Any]:
         return {
             'id': room.id,
             'memory_id': room.memory_id,
             'name': room.name,
             'created_at': room.created_at.isoformat(),
             'updated_at': room.updated_at.isoformat(),
-            'sessions_count': len(sessions),
-            'rounds_count': total_rounds
+            'sessions_count': sessions_count,
+            'rounds_count': rounds_count
         }
 
 
@@ -105,6 +190,7 @@ class SessionService:
             name=session_name,
             room=room
         )
+        invalidate_stats_cache()
         return session
     
     @staticmethod
@@ -118,11 +204,54 @@ class SessionService:
     @staticmethod
     def get_sessions_by_room(room_id: str) -> List[Session]:
         """获取指定房间的所有会话"""
-        room = RoomService.get_room(room_id)
-        if not room:
-            return []
-        return list(room.sessions.order_by(Session.created_at.desc()))
+        # 直接按外键过滤，无需先查询房间记录
+        return list(
+            Session.select()
+            .where(Session.room == room_id)
+            .order_by(Session.created_at.desc())
+        )
     
+    @staticmethod
+    def get_session_list(room_id: str) -> List[Dict[str, Any]]:
+        """获取指定房间所有会话的字典列表（字典行 + 一次分组聚合，不实例化模型）"""
+        rows = (
+            Session.select(
+                Session.id, Session.name, Session.room.alias('room_id'), Session.status,
+                Session.created_at, Session.updated_at
+            )
+            .where(Session.room == room_id)
+            .order_by(Session.created_at.desc())
+            .dicts()
+        )
+        totals_query = (
+            Round.select(Round.session, fn.COUNT(Round.id), fn.COALESCE(fn.SUM(Round.questions_count), 0))
+            .join(Session)
+            .where(Session.room == room_id)
+            .group_by(Round.session)
+            .tuples()
+        )
+        totals = {session_id: (rounds_count, questions_count)
+                  for session_id, rounds_count, questions_count in totals_query}
+        sessions = []
+        for row in rows:
+            rounds_count, questions_count = totals.get(row['id'], (0, 0))
+            row['created_at'] = row['created_at'].isoformat()
+            row['updated_at'] = row['updated_at'].isoformat()
+            row['rounds_count'] = rounds_count
+            row['questions_count'] = questions_count
+            sessions.append(row)
+        return sessions
+
+    @staticmethod
+    def count_by_room() -> Dict[str, int]:
+        """按面试间分组统计会话数量"""
+        query = (
+            Session.select(Session.room, fn.COUNT(Session.id))
+            .group_by(Session.room)
+            .tuples()
+        )
+        return dict(query)
+
     @staticmethod
     def delete_session(session_id: str) -> bool:
         """删除会话及其相关数据"""
@@ -131,8 +260,8 @@ class SessionService:
 
             # 删除相关的MinIO文件
             try:
-                from backend.clients.minio_client import minio_client
-                minio_client.delete_session_files(session_id)
+                from backend.clients.minio_client import get_minio_client
+                get_minio_client().delete_session_files(session_id, session.room_id)
             except Exception as e:
                 logger.warning(f"Failed to delete MinIO files for session {session_id}: {e}")
 
@@ -142,6 +271,7 @@ class SessionService:
 
             # 删除会话记录
             session.delete_instance()
+            invalidate_stats_cache()
             return True
         except Session.DoesNotExist:
             return False
@@ -160,20 +290,22 @@ class SessionService:
     @staticmethod
     def to_dict(session: Session) -> Dict[str, Any]:
         """将Session对象转换为字典"""
-        rounds = RoundService.get_rounds_by_session(session.id)
-        total_questions = 0
-        
-        for round_obj in rounds:
-            total_questions += round_obj.questions_count
-        
+        # 一次聚合查询得到轮次数和问题总数
+        rounds_count, total_questions = Round.select(
+            fn.COUNT(Round.id), fn.COALESCE(fn.SUM(Round.questions_count), 0)
+        ).where(Round.session == session.id).scalar(as_tuple=True)
+        return SessionService._serialize(session, rounds_count, total_questions)
+
+    @staticmethod
+    def _serialize(session: Session, rounds_count: int, total_questions: int) -> Dict[str, Any]:
         return {
             'id': session.id,
             'name': session.name,
-            'room_id': session.room.id,
+            'room_id': session.room_id,
             'status': session.status,
             'created_at': session.created_at.isoformat(),
             'updated_at': session.updated_at.isoformat(),
-            'rounds_count': len(rounds),
+            'rounds_count': rounds_count,
             'questions_count': total_questions
         }
 
@@ -190,7 +322,7 @@ class RoundService:
         
         round_id = str(uuid.uuid4())
         round_index = session.rounds.count()
-        questions_file_path = f"data/questions_round_{round_index}_{session_id}.json"
+        questions_file_path = questions_object_key(session.room_id, session_id, round_index)
         
         round_obj = Round.create(
             id=round_id,
@@ -202,6 +334,7 @@ class RoundService:
             current_question_index=0,
             status='active'
         )
+        invalidate_stats_cache()
         return round_obj
     
     @staticmethod
@@ -215,19 +348,49 @@ class RoundService:
     @staticmethod
     def get_rounds_by_session(session_id: str) -> List[Round]:
         """获取指定会话的所有轮次"""
-        session = SessionService.get_session(session_id)
-        if not session:
-            return []
-        return list(session.rounds.order_by(Round.round_index))
+        # 直接按外键过滤，无需先查询会话记录
+        return list(
+            Round.select()
+            .where(Round.session == session_id)
+            .order_by(Round.round_index)
+        )
+
+    @staticmethod
+    def get_round_list(session_id: str) -> List[Dict[str, Any]]:
+        """获取指定会话所有轮次的字典列表（直接读取字典行，不实例化模型）"""
+        rows = (
+            Round.select(
+                Round.id, Round.session.alias('session_id'), Round.round_index, Round.questions_count,
+                Round.questions_file_path, Round.round_type, Round.status,
+                Round.created_at, Round.updated_at
+            )
+            .where(Round.session == session_id)
+            .order_by(Round.round_index)
+            .dicts()
+        )
+        rounds = []
+        for row in rows:
+            row['created_at'] = row['created_at'].isoformat()
+            row['updated_at'] = row['updated_at'].isoformat()
+            rounds.append(row)
+        return rounds
+
+    @staticmethod
+    def count_by_room() -> Dict[str, int]:
+        """按面试间分组统计轮次数量"""
+        query = (
+            Round.select(Session.room, fn.COUNT(Round.id))
+            .join(Session)
+            .group_by(Session.room)
+            .tuples()
+        )
+        return dict(query)
 
     @staticmethod
     def get_round_by_session_and_index(session_id: str, round_index: int) -> Optional[Round]:
         """根据会话和轮次索引获取轮次记录"""
-        session = SessionService.get_session(session_id)
-        if not session:
-            return None
         return Round.select().where(
-            (Round.session == session) & (Round.round_index == round_index)
+            (Round.session == session_id) & (Round.round_index == round_index)
         ).first()
     
     @staticmethod
@@ -240,11 +403,11 @@ class RoundService:
             RoundService._delete_round_files(round_obj)
 
             # 删除相关的QuestionAnswer记录
-            from backend.models.models import QuestionAnswer
             QuestionAnswer.delete().where(QuestionAnswer.round == round_obj).execute()
 
             # 删除Round记录
             round_obj.delete_instance()
+            invalidate_stats_cache()
             return True
         except Round.DoesNotExist:
             return False
@@ -253,17 +416,14 @@ class RoundService:
     def _delete_round_files(round_obj: Round):
         """删除轮次相关的MinIO文件"""
         try:
-            from backend.clients.minio_client import minio_client
+            from backend.clients.minio_client import get_minio_client
 
-            # 删除题目文件: data/questions_round_{index}_{session_id}.json
-            questions_file = f"data/questions_round_{round_obj.round_index}_{round_obj.session.id}.json"
-            minio_client.delete_object(questions_file)
-            logger.info(f"Deleted questions file: {questions_file}")
-
-            # 删除分析文件: analysis/qa_complete_{round_index}_{session_id}.json
-            analysis_file = f"analysis/qa_complete_{round_obj.round_index}_{round_obj.session.id}.json"
-            minio_client.delete_object(analysis_file)
-            logger.info(f"Deleted analysis file: {analysis_file}")
+            # 题目文件（Round记录中保存的对象名称）和
+            # 分析文件 analysis/qa_complete_{round_index}_{session_id}.json，一次批量删除
+            questions_file = round_obj.questions_file_path
+            analysis_file = f"analysis/qa_complete_{round_obj.round_index}_{round_obj.session_id}.json"
+            get_minio_client().delete_objects([questions_file, analysis_file])
+            logger.info(f"Deleted round files: {questions_file}, {analysis_file}")
 
         except Exception as e:
             logger.error(f"Error deleting round files: {e}")
@@ -273,7 +433,7 @@ class RoundService:
         """将Round对象转换为字典"""
         return {
             'id': round_obj.id,
-            'session_id': round_obj.session.id,
+            'session_id': round_obj.session_id,
             'round_index': round_obj.round_index,
             'questions_count': round_obj.questions_count,
             'questions_file_path': round_obj.questions_file_path,
@@ -288,23 +448,21 @@ class RoundCompletionService:
     """轮次完成记录服务"""
 
     @staticmethod
-    def get_by_idempotency(idempotency_key: str) -> Optional[RoundCompletion]:
-        if not idempotency_key:
-            return None
-        try:
-            return RoundCompletion.get(
-                RoundCompletion.idempotency_key == idempotency_key
-            )
-        except RoundCompletion.DoesNotExist:
-            return None
+    def get_existing(idempotency_key: str, session: Session, round_index: int) -> Optional[RoundCompletion]:
+        """
+        查找已记录的完成事件（相同幂等键，或同一会话轮次已完成），一次查询完成
 
-    @staticmethod
-    def get_by_session_and_index(session: Optional[Session], round_index: int) -> Optional[RoundCompletion]:
-        if not session:
-            return None
+        Args:
+            idempotency_key: 幂等键
+            session: 会话对象
+            round_index: 轮次索引
+
+        Returns:
+            已存在的完成记录，不存在返回None
+        """
         return RoundCompletion.select().where(
-            (RoundCompletion.session == session) &
-            (RoundCompletion.round_index == round_index)
+            (RoundCompletion.idempotency_key == idempotency_key) |
+            ((RoundCompletion.session == session) & (RoundCompletion.round_index == round_index))
         ).first()
 
     @staticmethod
@@ -317,7 +475,10 @@ class RoundCompletionService:
         idempotency_key: str,
         round_obj: Optional[Round] = None
     ) -> RoundCompletion:
-        payload = json.dumps(qa_object, ensure_ascii=False) if isinstance(qa_object, (dict, list)) else str(qa_object)
+        payload = (
+            orjson.dumps(qa_object, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+            if isinstance(qa_object, (dict, list)) else str(qa_object)
+        )
 
         completion = RoundCompletion.create(
             id=str(uuid.uuid4()),
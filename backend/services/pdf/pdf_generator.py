@@ -10,7 +10,7 @@ from reportlab.lib.units import cm
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from backend.services.pdf.pdf_styles import PDFStyleManager
 from backend.services.pdf.pdf_charts import PDFChartGenerator
-from backend.clients.minio_client import minio_client
+from backend.clients.minio_client import get_minio_client
 from backend.common.logger import get_logger
 
 logger = get_logger(__name__)
@@ -186,14 +186,10 @@ class PDFReportGenerator:
             filename = f"reports/interview_report_{round_index}_{session_id}.pdf"
             pdf_stream = io.BytesIO(pdf_bytes)
 
-            # 上传到MinIO
-            minio_client.client.put_object(
-                minio_client.bucket_name,
-                filename,
-                data=pdf_stream,
-                length=len(pdf_bytes),
-                content_type='application/pdf'
-            )
+            # 上传到MinIO（较大的PDF自动分片并行上传）
+            if not get_minio_client().upload_stream(filename, pdf_stream, len(pdf_bytes),
+                                                    content_type='application/pdf'):
+                return None
 
             logger.info(f"PDF report saved to MinIO: {filename}")
             return filename
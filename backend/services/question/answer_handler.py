@@ -3,15 +3,21 @@
 负责管理问题回答、获取当前问题等
 """
 
-import json
-from datetime import datetime
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from backend.services.interview_service import RoundService
 from backend.models.models import QuestionAnswer
+from backend.clients.minio_client import upload_qa_analysis
+from backend.clients.rag.rag_client import get_rag_client
+from backend.common.clock import now_iso
 from backend.common.logger import get_logger
 
 logger = get_logger(__name__)
 
+# RAG记忆推送线程池：推送结果不影响答题响应，不在请求线程中等待RAG往返
+_rag_push_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='rag-push')
+
 
 class AnswerHandler:
     """答案处理器"""
@@ -137,7 +143,7 @@ class AnswerHandler:
 
             # 获取room_id和session_id
             session = round_obj.session
-            room_id = session.room.id
+            room_id = session.room_id
             session_id = session.id
 
             # 构建完整的QA数据
@@ -148,7 +154,7 @@ class AnswerHandler:
                     "room_id": room_id,
                     "round_index": round_obj.round_index,
                     "total_questions": qa_records.count(),
-                    "completed_at": datetime.now().isoformat(),
+                    "completed_at": now_iso(),
                     "round_type": round_obj.round_type
                 },
                 "session_info": {
@@ -177,17 +183,16 @@ class AnswerHandler:
                 })
 
             # 保存到MinIO（使用新的路径结构）
-            from backend.clients.minio_client import upload_qa_analysis
             success = upload_qa_analysis(qa_data, room_id, session_id, round_obj.round_index)
 
             if success:
                 logger.info(f"Complete QA data saved for LLM analysis: room={room_id}, session={session_id}, round={round_obj.round_index}")
 
-                # 推送到 RAG 记忆体
-                try:
-                    self._push_to_rag_memory(room_id, session_id, round_obj, qa_data)
-                except Exception as e:
-                    logger.error(f"Failed to push QA data to RAG memory: {e}", exc_info=True)
+                # 推送到 RAG 记忆体（后台执行；memory_id在请求线程中取好，后台线程不访问数据库）
+                _rag_push_executor.submit(
+                    self._push_to_rag_memory,
+                    session.room.memory_id, room_id, session_id, round_obj.round_index, qa_data
+                )
             else:
                 logger.warning(f"Failed to save QA analysis data")
 
@@ -196,31 +201,28 @@ class AnswerHandler:
 
     def _push_to_rag_memory(
         self,
+        memory_id: str,
         room_id: str,
         session_id: str,
-        round_obj,
+        round_index: int,
         qa_data: Dict[str, Any]
     ):
         """
-        推送问答数据到 RAG 记忆体
+        推送问答数据到 RAG 记忆体（在后台线程中执行，失败只记录日志）
 
         Args:
+            memory_id: 面试间的记忆体ID
             room_id: 面试间ID
             session_id: 会话ID
-            round_obj: 轮次对象
+            round_index: 轮次索引
             qa_data: 完整的问答数据
         """
-        from backend.clients.rag.rag_client import get_rag_client
-
         try:
-            room = round_obj.session.room
-            memory_id = room.memory_id
-
             # 构建 MinIO 路径作为 URL
-            minio_url = f"rooms/{room_id}/sessions/{session_id}/analysis/round_{round_obj.round_index}.json"
+            minio_url = f"rooms/{room_id}/sessions/{session_id}/analysis/round_{round_index}.json"
 
             # 将 qa_data 转换为 JSON 字符串作为 description
-            description = json.dumps(qa_data, ensure_ascii=False)
+            description = orjson.dumps(qa_data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
 
             # 推送到 RAG
             rag_client = get_rag_client()
@@ -234,5 +236,4 @@ class AnswerHandler:
             logger.info(f"Successfully pushed QA data to RAG memory {memory_id}: {minio_url}")
 
         except Exception as e:
-            logger.error(f"Error pushing to RAG memory: {e}", exc_info=True)
-            raise
+            logger.error(f"Failed to push QA data to RAG memory: {e}", exc_info=True)
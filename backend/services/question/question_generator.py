@@ -4,24 +4,29 @@
 """
 
 import uuid
-import json
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
-from backend.services.interview_service import RoundService
-from backend.models.models import QuestionAnswer
-from backend.clients.minio_client import upload_questions_data, download_resume_data
-from backend.clients.llm.qwen_client import QwenClient
+from backend.services.interview_service import RoundService, SessionService
+from backend.models.models import QuestionAnswer, database
+from backend.clients.minio_client import (
+    upload_questions_data, download_resume_data, merge_session_questions_index
+)
+from backend.clients.llm.qwen_client import get_qwen_client
 from backend.clients.rag.rag_client import get_rag_client
+from backend.common.clock import now_iso
 from backend.common.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 后台持久化线程池：题目上传MinIO与写库并行进行
+_persist_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='persist')
+
 
 class QuestionGenerator:
     """面试题生成器"""
 
     def __init__(self):
-        self.qwen_client = QwenClient()
+        self.qwen_client = get_qwen_client()
         self.use_rag = True  # 是否使用 RAG 服务
 
     def generate_questions(self, session_id: str) -> Optional[Dict[str, Any]]:
@@ -36,7 +41,6 @@ class QuestionGenerator:
         """
         try:
             # 0. 获取session信息
-            from backend.services.interview_service import SessionService
             session = SessionService.get_session(session_id)
             if not session:
                 return {
@@ -44,11 +48,10 @@ class QuestionGenerator:
                     'error': '会话不存在'
                 }
 
-            room_id = session.room.id
+            room_id = session.room_id
             room = session.room
 
             # 1. 加载简历数据（使用room_id）
-            from backend.clients.minio_client import download_resume_data
             resume_data = download_resume_data(room_id)
             if not resume_data:
                 return {
@@ -89,11 +92,9 @@ class QuestionGenerator:
             if not round_obj:
                 raise ValueError("创建轮次失败")
 
-            # 6. 创建问答记录
-            self._create_question_answer_records(round_obj, categorized_questions)
-
-            # 7. 保存问题到MinIO（使用新的路径结构）
-            success = self._save_questions_to_minio(
+            # 6. 保存问题到MinIO（使用新的路径结构），与写入问答记录并行进行
+            upload_future = _persist_executor.submit(
+                self._save_questions_to_minio,
                 all_questions,
                 round_obj,
                 room_id,
@@ -101,6 +102,12 @@ class QuestionGenerator:
                 categorized_questions
             )
 
+            # 7. 创建问答记录
+            self._create_question_answer_records(round_obj, categorized_questions)
+
+            # 启动LLM前题目文件必须已写入MinIO，这里等待上传完成
+            success = upload_future.result()
+
             if not success:
                 logger.warning(f"Failed to save questions to MinIO for round {round_obj.id}")
 
@@ -162,22 +169,19 @@ class QuestionGenerator:
         if not resume_data:
             return ""
 
-        content = f"""
-姓名：{resume_data.get('name', '')}
-职位：{resume_data.get('position', '')}
+        lines = [
+            "",
+            f"姓名：{resume_data.get('name', '')}",
+            f"职位：{resume_data.get('position', '')}",
+            "",
+            "技能：",
+        ]
+        lines.extend(f"{i}. {skill}" for i, skill in enumerate(resume_data.get('skills', []), 1))
+        lines.append("")
+        lines.append("项目经验：")
+        lines.extend(f"{i}. {project}" for i, project in enumerate(resume_data.get('projects', []), 1))
 
-技能：
-"""
-        skills = resume_data.get('skills', [])
-        for i, skill in enumerate(skills, 1):
-            content += f"{i}. {skill}\n"
-
-        content += "\n项目经验：\n"
-        projects = resume_data.get('projects', [])
-        for i, project in enumerate(projects, 1):
-            content += f"{i}. {project}\n"
-
-        return content.strip()
+        return "\n".join(lines).strip()
 
     def _merge_questions(self, categorized_questions: Dict[str, List[str]]) -> List[str]:
         """合并分类问题为单一列表"""
@@ -188,21 +192,28 @@ class QuestionGenerator:
         return all_questions
 
     def _create_question_answer_records(self, round_obj, categorized_questions: Dict[str, List[str]]):
-        """为轮次创建问答记录"""
+        """为轮次创建问答记录（单事务批量插入）"""
+        rows = []
         question_index = 0
 
         for category, questions in categorized_questions.items():
             for question in questions:
-                QuestionAnswer.create(
-                    id=str(uuid.uuid4()),
-                    round=round_obj,
-                    question_index=question_index,
-                    question_text=question,
-                    question_category=category,
-                    is_answered=False
-                )
+                rows.append({
+                    'id': str(uuid.uuid4()),
+                    'round': round_obj.id,
+                    'question_index': question_index,
+                    'question_text': question,
+                    'question_category': category,
+                    'is_answered': False
+                })
                 question_index += 1
 
+        if not rows:
+            return
+
+        with database.atomic():
+            QuestionAnswer.insert_many(rows).execute()
+
     def _save_questions_to_minio(
         self,
         all_questions: List[str],
@@ -211,9 +222,7 @@ class QuestionGenerator:
         session_id: str,
         categorized_questions: Dict[str, List[str]]
     ) -> bool:
-        """保存问题到MinIO（使用新的目录结构）"""
-        from backend.clients.minio_client import upload_questions_data
-
+        """保存问题到MinIO（轮次文件供LLM服务读取，同时合并进会话问题索引）"""
         qa_data = {
             'questions': all_questions,
             'round_id': round_obj.id,
@@ -221,8 +230,12 @@ class QuestionGenerator:
             'room_id': room_id,
             'round_index': round_obj.round_index,
             'total_count': len(all_questions),
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': now_iso(),
             'categorized_questions': categorized_questions
         }
 
-        return upload_questions_data(qa_data, room_id, session_id, round_obj.round_index)
+        success = upload_questions_data(qa_data, room_id, session_id, round_obj.round_index)
+        if success and not merge_session_questions_index(qa_data, room_id, session_id, round_obj.round_index):
+            # 索引缺失的轮次在读取时会回退到轮次文件，这里不视为失败
+            logger.warning(f"Failed to update questions index for session {session_id}")
+        return success
@@ -0,0 +1,186 @@
+"""
+面试报告生成服务
+报告生成（大模型评价 + PDF渲染 + MinIO上传）耗时较长，在后台线程中执行，
+HTTP请求只负责提交任务和查询任务状态。
+任务状态保存在数据库中，多进程部署时任一工作进程都能查询到其他进程提交的任务。
+"""
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+import orjson
+from backend.models.models import ReportTask, database
+from backend.common.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 任务状态
+TASK_PENDING = 'pending'
+TASK_RUNNING = 'running'
+TASK_SUCCESS = 'success'
+TASK_FAILED = 'failed'
+
+# 同时生成报告的最大数量（每个任务都会调用大模型并渲染PDF）
+REPORT_WORKERS = 2
+
+# 任务状态保留时间（秒），超时后查询返回不存在
+TASK_TTL = 3600
+
+# 进行中的任务超过该时间（秒）未更新视为已中断（如所在工作进程退出），允许重新提交
+TASK_TIMEOUT = 600
+
+
+class ReportService:
+    """面试报告生成服务（进程内后台任务）"""
+
+    def __init__(self, max_workers: int = REPORT_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='report')
+
+    def submit(self, session_id: str, round_index: int) -> Dict[str, Any]:
+        """
+        提交报告生成任务（同一会话轮次已有进行中的任务时直接返回该任务）
+
+        Args:
+            session_id: 会话ID
+            round_index: 轮次索引
+
+        Returns:
+            任务信息
+        """
+        now = datetime.now()
+        # IMMEDIATE事务开始即获取写锁，多个工作进程的"查找-创建"串行执行，不会重复生成同一份报告
+        with database.atomic(lock_type='IMMEDIATE'):
+            ReportTask.delete().where(ReportTask.updated_at < now - timedelta(seconds=TASK_TTL)).execute()
+
+            task = (
+                ReportTask.select()
+                .where(
+                    (ReportTask.session_id == session_id) &
+                    (ReportTask.round_index == round_index) &
+                    ReportTask.status.in_((TASK_PENDING, TASK_RUNNING)) &
+                    (ReportTask.updated_at >= now - timedelta(seconds=TASK_TIMEOUT))
+                )
+                .order_by(ReportTask.created_at.desc())
+                .first()
+            )
+            if task:
+                return self._to_dict(task)
+
+            task = ReportTask.create(
+                id=str(uuid.uuid4()),
+                session_id=session_id,
+                round_index=round_index,
+                status=TASK_PENDING
+            )
+
+        self._executor.submit(self._run, task.id, session_id, round_index)
+        logger.info("Report task %s submitted for session %s, round %s", task.id, session_id, round_index)
+        return self._to_dict(task)
+
+    def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """获取任务信息，不存在或已过期返回None"""
+        task = ReportTask.get_or_none(
+            (ReportTask.id == task_id) &
+            (ReportTask.updated_at >= datetime.now() - timedelta(seconds=TASK_TTL))
+        )
+        return self._to_dict(task) if task else None
+
+    def generate(self, session_id: str, round_index: int) -> Dict[str, Any]:
+        """
+        生成评价报告和PDF报告并保存到MinIO
+
+        Args:
+            session_id: 会话ID
+            round_index: 轮次索引
+
+        Returns:
+            生成结果，包含success及data或error
+        """
+        # 延迟导入：评价服务和PDF服务依赖MinIO/大模型客户端，任务管理本身不需要
+        from backend.services.evaluation_service import get_evaluation_service
+        from backend.services.pdf import get_pdf_generator
+
+        # 生成评价数据，评价报告JSON在后台上传，同时生成PDF
+        eval_result = get_evaluation_service().generate_evaluation_report(
+            session_id, round_index, defer_save=True
+        )
+        if not eval_result.get('success'):
+            return {'success': False, 'error': eval_result.get('error', '生成评价失败')}
+
+        # 生成PDF报告
+        pdf_generator = get_pdf_generator()
+        pdf_bytes = pdf_generator.generate_report_pdf(eval_result['report_data'])
+
+        # 保存PDF到MinIO
+        pdf_filename = None
+        if pdf_bytes:
+            pdf_filename = pdf_generator.save_pdf_to_minio(pdf_bytes, session_id, round_index)
+
+        # 确认评价报告已保存
+        try:
+            eval_result['save_future'].result()
+        except Exception as e:
+            logger.error(f"Failed to save evaluation report: {e}")
+            return {'success': False, 'error': str(e)}
+
+        if not pdf_bytes:
+            return {'success': False, 'error': 'PDF生成失败'}
+
+        if not pdf_filename:
+            return {'success': False, 'error': 'PDF保存失败'}
+
+        return {
+            'success': True,
+            'data': {
+                'evaluation_filename': eval_result['report_filename'],
+                'pdf_filename': pdf_filename,
+                'report_data': eval_result['report_data']
+            }
+        }
+
+    def _run(self, task_id: str, session_id: str, round_index: int) -> None:
+        """在后台线程中执行报告生成任务"""
+        self._update(task_id, status=TASK_RUNNING)
+        try:
+            result = self.generate(session_id, round_index)
+        except Exception as e:
+            logger.error(f"Report task {task_id} failed: {e}", exc_info=True)
+            result = {'success': False, 'error': f'生成报告失败: {str(e)}'}
+
+        if result.get('success'):
+            self._update(task_id, status=TASK_SUCCESS,
+                         result=orjson.dumps(result['data'], option=orjson.OPT_NON_STR_KEYS).decode())
+        else:
+            self._update(task_id, status=TASK_FAILED, error=result.get('error'))
+
+    @staticmethod
+    def _update(task_id: str, **fields: Any) -> None:
+        """更新任务信息"""
+        ReportTask.update(**fields, updated_at=datetime.now()).where(ReportTask.id == task_id).execute()
+
+    @staticmethod
+    def _to_dict(task: ReportTask) -> Dict[str, Any]:
+        """将ReportTask对象转换为字典"""
+        return {
+            'task_id': task.id,
+            'session_id': task.session_id,
+            'round_index': task.round_index,
+            'status': task.status,
+            'result': orjson.loads(task.result) if task.result else None,
+            'error': task.error,
+            'created_at': task.created_at.isoformat(),
+            'updated_at': task.updated_at.isoformat()
+        }
+
+
+# 全局报告服务实例
+_report_service = None
+
+
+def get_report_service() -> ReportService:
+    """获取报告服务实例（延迟初始化）"""
+    global _report_service
+    if _report_service is None:
+        _report_service = ReportService()
+    return _report_service
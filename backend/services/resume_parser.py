@@ -2,10 +2,10 @@
 简历解析服务
 """
 
-import json
+import orjson
 import re
 from typing import Dict, Any, Optional
-from backend.clients.llm.qwen_client import QwenClient
+from backend.clients.llm.qwen_client import get_qwen_client
 from backend.clients.llm.prompts.resume_prompts import get_resume_extraction_prompt
 from backend.common.logger import get_logger
 
@@ -16,7 +16,7 @@ class ResumeParser:
     """简历内容解析器，从Markdown提取结构化数据"""
 
     def __init__(self):
-        self.qwen_client = QwenClient()
+        self.qwen_client = get_qwen_client()
 
     def extract_resume_data(self, markdown_content: str) -> Optional[Dict[str, Any]]:
         """
@@ -81,10 +81,10 @@ class ResumeParser:
                     cleaned_response = cleaned_response[start_idx:end_idx + 1]
 
             # 尝试解析JSON
-            resume_data = json.loads(cleaned_response)
+            resume_data = orjson.loads(cleaned_response)
             return resume_data
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"JSON decode error: {e}")
             logger.debug(f"Response content: {response[:500]}")
 
@@ -92,7 +92,7 @@ class ResumeParser:
             try:
                 json_match = re.search(r'\{.*\}', response, re.DOTALL)
                 if json_match:
-                    resume_data = json.loads(json_match.group(0))
+                    resume_data = orjson.loads(json_match.group(0))
                     return resume_data
             except Exception as ex:
                 logger.error(f"Regex extraction also failed: {ex}")
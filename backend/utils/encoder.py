@@ -1,9 +1,11 @@
 # -*- coding:utf-8 -*-
 from backend.models.base_model import Model
-import json
 from datetime import date, datetime
 from decimal import Decimal
 
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
 
 def custom_json_default(obj):
     if isinstance(obj, Model):
@@ -22,6 +24,42 @@ def custom_json_default(obj):
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
-# 可选：封装一个 dumps 函数
+# 可选：封装一个 dumps 函数（与 OrjsonProvider 输出一致）
 def dumps(obj, **kwargs):
-    return json.dumps(obj, default=custom_json_default, **kwargs)
\ No newline at end of file
+    option = orjson.OPT_NON_STR_KEYS
+    if kwargs.get('indent'):
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=custom_json_default, option=option).decode('utf-8')
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """基于 orjson 的 Flask JSON Provider，jsonify/get_json 均走 orjson"""
+
+    default = staticmethod(custom_json_default)
+    # 不排序、不缩进：debug 模式下也不走 indent=2 的慢路径
+    sort_keys = False
+    compact = True
+
+    def _options(self, indent: bool = False) -> int:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(
+            obj,
+            default=kwargs.get('default', self.default),
+            option=self._options(bool(kwargs.get('indent')))
+        ).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # 直接输出 bytes，省去 str 中间结果和再次 encode
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._options())
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+进程内缓存测试
+"""
+
+import unittest
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 添加项目路径
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from backend.common.cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """TTL缓存测试"""
+
+    def test_set_and_get(self):
+        """测试写入和读取"""
+        cache = TTLCache(ttl=60)
+        cache.set('room', {'name': '李明'})
+        self.assertEqual(cache.get('room'), {'name': '李明'})
+        self.assertIsNone(cache.get('missing'))
+
+    def test_expiration(self):
+        """测试过期淘汰"""
+        cache = TTLCache(ttl=0.01)
+        cache.set('room', 1)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get('room'))
+        self.assertEqual(len(cache), 0)
+
+    def test_maxsize_evicts_oldest(self):
+        """测试超出容量时淘汰最早写入的条目"""
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('b'), 2)
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_delete(self):
+        """测试删除"""
+        cache = TTLCache(ttl=60)
+        cache.set('room', 1)
+        cache.delete('room')
+        cache.delete('room')
+        self.assertIsNone(cache.get('room'))
+
+    def test_get_or_load(self):
+        """测试未命中时加载并缓存，None结果不缓存"""
+        cache = TTLCache(ttl=60)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return {'name': '李明'}
+
+        self.assertEqual(cache.get_or_load('room', loader), {'name': '李明'})
+        self.assertEqual(cache.get_or_load('room', loader), {'name': '李明'})
+        self.assertEqual(len(calls), 1)
+
+        self.assertIsNone(cache.get_or_load('missing', lambda: None))
+        self.assertEqual(cache.get_or_load('missing', lambda: 1), 1)
+
+    def test_get_or_load_coalesces_concurrent_misses(self):
+        """测试同一键的并发未命中只加载一次"""
+        cache = TTLCache(ttl=60)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def loader():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return 'value'
+
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_load('room', loader)))
+                   for _ in range(5)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ['value'] * 5)
+
+    def test_get_or_load_propagates_errors(self):
+        """测试加载异常会抛出且不缓存"""
+        cache = TTLCache(ttl=60)
+
+        def loader():
+            raise RuntimeError('minio down')
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_load('room', loader)
+        self.assertEqual(cache.get_or_load('room', lambda: 1), 1)
+
+
+if __name__ == '__main__':
+    print("Running cache tests...")
+    unittest.main()
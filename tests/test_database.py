@@ -14,11 +14,14 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
+# 测试日志写到临时目录，不写入应用日志文件logs/interviewer.log
+os.environ.setdefault('LOG_FILE', os.path.join(tempfile.gettempdir(), 'interviewer-test.log'))
+
 # 设置测试数据库
 os.environ['DATABASE_PATH'] = ':memory:'  # 使用内存数据库
 
-from backend.models.models import init_database, Room, Session, Round
-from backend.services.interview_service import RoomService, SessionService, RoundService
+from backend.models.models import init_database, Room, Session, Round, QuestionAnswer, RoundCompletion
+from backend.services.interview_service import RoomService, SessionService, RoundService, invalidate_stats_cache
 
 
 class TestDatabaseModels(unittest.TestCase):
@@ -27,19 +30,22 @@ class TestDatabaseModels(unittest.TestCase):
     def setUp(self):
         """每个测试前的设置"""
         # 重新连接数据库以确保表存在
-        from backend.models.models import database, Room, Session, Round
+        from backend.models.models import database
         if not database.is_closed():
             database.close()
         database.connect()
-        database.create_tables([Room, Session, Round], safe=True)
+        database.create_tables([Room, Session, Round, QuestionAnswer, RoundCompletion], safe=True)
     
     def tearDown(self):
         """每个测试后的清理"""
-        from backend.models.models import database, Room, Session, Round
+        from backend.models.models import database
         # 清理数据
+        RoundCompletion.delete().execute()
+        QuestionAnswer.delete().execute()
         Round.delete().execute()
         Session.delete().execute()
         Room.delete().execute()
+        invalidate_stats_cache()
         database.close()
     
     def test_room_creation(self):
@@ -71,6 +77,10 @@ class TestDatabaseModels(unittest.TestCase):
         self.assertEqual(round_obj.session.id, session.id)
         self.assertEqual(round_obj.questions_count, 3)
         self.assertEqual(round_obj.round_index, 0)
+        self.assertEqual(
+            round_obj.questions_file_path,
+            f"rooms/{room.id}/sessions/{session.id}/questions/round_0.json"
+        )
     
     def test_room_sessions_relationship(self):
         """测试房间和会话的关系"""
@@ -140,6 +150,100 @@ class TestDatabaseModels(unittest.TestCase):
         self.assertIn('round_index', round_dict)
         self.assertIn('questions_count', round_dict)
 
+    def test_room_list_serialization(self):
+        """测试面试间列表的会话数和轮次数统计"""
+        room1 = RoomService.create_room("房间1")
+        room2 = RoomService.create_room("房间2")
+        session = SessionService.create_session(room1.id, "会话1")
+        SessionService.create_session(room1.id, "会话2")
+        RoundService.create_round(session.id, ["问题1"])
+        RoundService.create_round(session.id, ["问题2"])
+
+        by_id = {room['id']: room for room in RoomService.get_room_list()}
+        self.assertEqual(by_id[room1.id]['sessions_count'], 2)
+        self.assertEqual(by_id[room1.id]['rounds_count'], 2)
+        self.assertEqual(by_id[room2.id]['sessions_count'], 0)
+        self.assertEqual(by_id[room2.id]['rounds_count'], 0)
+
+    def test_session_list_serialization(self):
+        """测试会话列表的轮次数和问题总数统计"""
+        room = RoomService.create_room("测试房间")
+        session1 = SessionService.create_session(room.id, "会话1")
+        session2 = SessionService.create_session(room.id, "会话2")
+        RoundService.create_round(session1.id, ["问题1", "问题2"])
+        RoundService.create_round(session1.id, ["问题3"])
+
+        by_id = {session['id']: session for session in SessionService.get_session_list(room.id)}
+        self.assertEqual(by_id[session1.id]['rounds_count'], 2)
+        self.assertEqual(by_id[session1.id]['questions_count'], 3)
+        self.assertEqual(by_id[session2.id]['rounds_count'], 0)
+        self.assertEqual(by_id[session2.id]['questions_count'], 0)
+
+    def test_dict_row_lists(self):
+        """测试按字典行构建的列表与模型序列化结果一致"""
+        room = RoomService.create_room("测试房间")
+        session1 = SessionService.create_session(room.id, "会话1")
+        SessionService.create_session(room.id, "会话2")
+        RoundService.create_round(session1.id, ["问题1", "问题2"])
+        RoundService.create_round(session1.id, ["问题3"])
+
+        self.assertEqual(
+            RoomService.get_room_list(),
+            [RoomService.to_dict(r) for r in RoomService.get_all_rooms()]
+        )
+        self.assertEqual(
+            SessionService.get_session_list(room.id),
+            [SessionService.to_dict(s) for s in SessionService.get_sessions_by_room(room.id)]
+        )
+        self.assertEqual(
+            RoundService.get_round_list(session1.id),
+            [RoundService.to_dict(r) for r in RoundService.get_rounds_by_session(session1.id)]
+        )
+        self.assertEqual(SessionService.get_session_list("missing"), [])
+
+    def test_room_list_cache(self):
+        """测试面试间列表缓存在增删后失效"""
+        room = RoomService.create_room("房间1")
+        version = RoomService.version()
+        self.assertEqual([r['id'] for r in RoomService.get_room_list()], [room.id])
+
+        session = SessionService.create_session(room.id, "会话1")
+        self.assertGreater(RoomService.version(), version)
+        self.assertEqual(RoomService.get_room_list()[0]['sessions_count'], 1)
+
+        SessionService.delete_session(session.id)
+        RoomService.delete_room(room.id)
+        self.assertEqual(RoomService.get_room_list(), [])
+
+    def test_system_stats(self):
+        """测试系统统计数据"""
+        empty_stats = RoomService.get_stats()
+        self.assertEqual(empty_stats['total_rooms'], 0)
+        self.assertEqual(empty_stats['total_questions'], 0)
+
+        room = RoomService.create_room("测试房间")
+        session1 = SessionService.create_session(room.id, "会话1")
+        session2 = SessionService.create_session(room.id, "会话2")
+        RoundService.create_round(session1.id, ["问题1", "问题2"])
+        RoundService.create_round(session1.id, ["问题3"])
+        RoundService.create_round(session2.id, ["问题1", "问题2", "问题3"])
+        RoomService.create_room("空房间")
+
+        stats = RoomService.get_stats()
+        self.assertEqual(stats, {
+            'total_rooms': 2,
+            'total_sessions': 2,
+            'total_rounds': 3,
+            'total_questions': 6
+        })
+
+        # 删除后统计数据应立即刷新
+        RoomService.delete_room(room.id)
+        stats = RoomService.get_stats()
+        self.assertEqual(stats['total_rooms'], 1)
+        self.assertEqual(stats['total_sessions'], 0)
+        self.assertEqual(stats['total_questions'], 0)
+
 
 if __name__ == '__main__':
     print("Running database and service tests...")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+报告生成任务测试
+"""
+
+import unittest
+import os
+import tempfile
+import sys
+import threading
+from pathlib import Path
+
+# 添加项目路径
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+# 测试日志写到临时目录，不写入应用日志文件logs/interviewer.log
+os.environ.setdefault('LOG_FILE', os.path.join(tempfile.gettempdir(), 'interviewer-test.log'))
+
+# 设置测试数据库（不连接真实数据库文件，测试中再切换到临时文件）
+os.environ['DATABASE_PATH'] = ':memory:'
+
+from backend.models.models import ReportTask, database
+from backend.services.report_service import ReportService, TASK_SUCCESS, TASK_FAILED
+
+
+class FakeReportService(ReportService):
+    """以固定结果代替真实报告生成，便于测试任务状态流转"""
+
+    def __init__(self, result):
+        super().__init__(max_workers=1)
+        self.result = result
+        self.release = threading.Event()
+        self.calls = 0
+
+    def generate(self, session_id, round_index):
+        self.calls += 1
+        self.release.wait(5)
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+class TestReportService(unittest.TestCase):
+    """报告生成任务测试"""
+
+    @classmethod
+    def setUpClass(cls):
+        # 任务状态在后台线程中读写，内存数据库的每个连接彼此独立，这里改用临时数据库文件
+        cls._db_dir = tempfile.TemporaryDirectory()
+        cls._database_path = database.database
+        database.init(os.path.join(cls._db_dir.name, 'report_tasks.db'))
+        database.create_tables([ReportTask], safe=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        database.close()
+        database.init(cls._database_path)
+        cls._db_dir.cleanup()
+
+    def tearDown(self):
+        ReportTask.delete().execute()
+
+    def _wait(self, service, task_id):
+        service._executor.shutdown(wait=True)
+        return service.get_task(task_id)
+
+    def test_task_success(self):
+        """测试任务成功后返回生成结果"""
+        service = FakeReportService({'success': True, 'data': {'pdf_filename': 'report.pdf'}})
+        task = service.submit('session-1', 0)
+        service.release.set()
+
+        task = self._wait(service, task['task_id'])
+        self.assertEqual(task['status'], TASK_SUCCESS)
+        self.assertEqual(task['result'], {'pdf_filename': 'report.pdf'})
+        self.assertIsNone(task['error'])
+
+    def test_task_failure(self):
+        """测试生成失败和异常都记录为失败状态"""
+        service = FakeReportService({'success': False, 'error': 'PDF生成失败'})
+        task = service.submit('session-1', 0)
+        service.release.set()
+        self.assertEqual(self._wait(service, task['task_id'])['error'], 'PDF生成失败')
+
+        service = FakeReportService(RuntimeError('boom'))
+        task = service.submit('session-1', 0)
+        service.release.set()
+        task = self._wait(service, task['task_id'])
+        self.assertEqual(task['status'], TASK_FAILED)
+        self.assertIn('boom', task['error'])
+
+    def test_duplicate_submit_reuses_running_task(self):
+        """测试同一轮次重复提交时复用进行中的任务"""
+        service = FakeReportService({'success': True, 'data': {}})
+        first = service.submit('session-1', 0)
+        second = service.submit('session-1', 0)
+        other = service.submit('session-1', 1)
+        service.release.set()
+        self._wait(service, first['task_id'])
+
+        self.assertEqual(first['task_id'], second['task_id'])
+        self.assertNotEqual(first['task_id'], other['task_id'])
+        self.assertEqual(service.calls, 2)
+
+    def test_task_shared_between_services(self):
+        """测试任务状态对其他服务实例（其他工作进程）可见，且不会重复提交"""
+        service = FakeReportService({'success': True, 'data': {}})
+        other = FakeReportService({'success': True, 'data': {}})
+        task = service.submit('session-1', 0)
+
+        self.assertEqual(other.submit('session-1', 0)['task_id'], task['task_id'])
+        service.release.set()
+        self.assertEqual(self._wait(service, task['task_id'])['status'], TASK_SUCCESS)
+        self.assertEqual(other.get_task(task['task_id'])['status'], TASK_SUCCESS)
+        self.assertEqual(other.calls, 0)
+
+    def test_unknown_task(self):
+        """测试查询不存在的任务"""
+        self.assertIsNone(ReportService(max_workers=1).get_task('missing'))
+
+
+if __name__ == '__main__':
+    print("Running report service tests...")
+    unittest.main()